@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
@@ -326,6 +328,9 @@ def sum_deposits_and_accounts(
 # Default to a broadly available, fast model
 _DEF_MODEL = "gpt-4o-mini"
 
+# PyMuPDF/pdfplumber are not thread-safe; concurrent statements share the OpenAI wait, not parsing
+_EXTRACT_LOCK = threading.Lock()
+
 
 def gpt_extract_entities(
     openai_api_key: str, ocr_text: str
@@ -394,7 +399,8 @@ def gpt_analyze_bank_statement(
     pdf_path: str, openai_api_key: str, subfolder: Path
 ) -> str:
     company_name = extract_company_name(pdf_path)
-    ocr_text = extract_text_from_pdf(pdf_path)
+    with _EXTRACT_LOCK:
+        ocr_text = extract_text_from_pdf(pdf_path)
 
     # 1) GPT finds entities only
     processors, accounts = gpt_extract_entities(openai_api_key, ocr_text)
@@ -532,9 +538,36 @@ def gpt_analyze_bank_statement(
     return str(summary_path)
 
 
+def _ai_concurrency() -> int:
+    """Statements analyzed at once; OPENAI_MAX_CONCURRENCY overrides the default of 4."""
+    try:
+        return max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
 def process_bank_statements_ai(
     filepaths: Iterable[str], openai_api_key: str, content_frame=None
 ) -> None:
+    filepaths = list(filepaths)
+    jobs = min(len(filepaths), _ai_concurrency())
+    if content_frame is None and jobs > 1:
+        # Each statement waits on OpenAI round-trips, so keep several requests in flight.
+        # PDF text extraction stays serialized under _EXTRACT_LOCK.
+        with ThreadPoolExecutor(max_workers=jobs) as ex:
+            futures = [
+                ex.submit(
+                    gpt_analyze_bank_statement,
+                    p,
+                    openai_api_key,
+                    get_statement_subfolder(p),
+                )
+                for p in filepaths
+            ]
+            for fut in futures:
+                fut.result()
+        return
+
     for pdf_path in filepaths:
         subfolder = get_statement_subfolder(pdf_path)
         summary_path = gpt_analyze_bank_statement(pdf_path, openai_api_key, subfolder)
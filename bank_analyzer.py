@@ -494,7 +494,16 @@ def extract_text_from_pdf(pdf_path):
             return text
 
 
-def process_bank_statements_full(filepaths, content_frame=None, progress_cb: Optional[Callable[[str], None]] = None):
+def process_bank_statements_full(
+    filepaths,
+    content_frame=None,
+    progress_cb: Optional[Callable[[str], None]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+):
+    """Redact processor pages and write a summary per statement.
+
+    progress_cb receives step messages; on_progress(done, total) is called after each file.
+    """
     # Get merchant processors (known) and exclusions
     merchant_keywords = bsa_settings.get_all_merchants() + [
         "Square",
@@ -608,6 +617,11 @@ def process_bank_statements_full(filepaths, content_frame=None, progress_cb: Opt
                 progress_cb(f"Saved summary: {os.path.basename(summary_pdf)}")
             except Exception:
                 pass
+        if on_progress:
+            try:
+                on_progress(idx, total_files)
+            except Exception:
+                pass
 
 
 def detect_section_headers(text: str):
@@ -148,16 +148,30 @@ def edit_merchant_by_id(row_id, root, name, co, address, city, state, zip_code,
 edit_merchant_full_by_id = edit_merchant_by_id
 
 
-def delete_merchants_by_ids(list_of_ids):
-    """Delete merchants by list of row IDs (for GUI)."""
+# Stay under SQLite's host-parameter limit (999 on older builds) per statement
+_DELETE_CHUNK = 500
+
+
+def _delete_where_in(table, column, values):
+    """DELETE rows whose column is in values, a chunk of values per statement."""
+    values = list(values)
+    if not values:
+        return
     conn = connect_db()
     c = conn.cursor()
-    for row_id in list_of_ids:
-        c.execute("DELETE FROM MerchantProcessors WHERE id = ?", (row_id,))
+    for start in range(0, len(values), _DELETE_CHUNK):
+        chunk = values[start : start + _DELETE_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        c.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", chunk)
     conn.commit()
     conn.close()
 
 
+def delete_merchants_by_ids(list_of_ids):
+    """Delete merchants by list of row IDs (for GUI)."""
+    _delete_where_in("MerchantProcessors", "id", list_of_ids)
+
+
 # ---- Exclusion List CRUD ----
 
 
@@ -208,12 +222,7 @@ def edit_exclusion_by_id(row_id, entity, reason, notes):
 
 def delete_exclusions_by_ids(list_of_ids):
     """Delete exclusions by list of row IDs (for GUI)."""
-    conn = connect_db()
-    c = conn.cursor()
-    for row_id in list_of_ids:
-        c.execute("DELETE FROM Exclusions WHERE id = ?", (row_id,))
-    conn.commit()
-    conn.close()
+    _delete_where_in("Exclusions", "id", list_of_ids)
 
 
 # --- Export/Import for .txt files (all fields, CSV format recommended) ---
@@ -221,21 +230,28 @@ def delete_exclusions_by_ids(list_of_ids):
 
 def export_merchants_txt(filepath):
     """Export all merchants to a .txt (CSV) file."""
-    merchants = get_all_merchants_with_ids()
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        # Write header
-        writer.writerow(
-            ["root", "name", "co", "address", "city", "state", "zip", "notes"]
+    conn = connect_db()
+    try:
+        rows = conn.execute(
+            "SELECT root, name, co, address, city, state, zip, notes "
+            "FROM MerchantProcessors ORDER BY name COLLATE NOCASE"
         )
-        for _, root, name, co, address, city, state, zip_code, notes in merchants:
-            writer.writerow([root, name, co, address, city, state, zip_code, notes])
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            # Write header
+            writer.writerow(
+                ["root", "name", "co", "address", "city", "state", "zip", "notes"]
+            )
+            writer.writerows(rows)  # streamed from the cursor, not fetched first
+    finally:
+        conn.close()
 
 
 def import_merchants_txt(filepath):
-    """Import merchant list from a .txt (CSV) file."""
-    with open(filepath, encoding="utf-8") as f:
-        reader = csv.reader(f)
+    """Import merchant list from a .txt (CSV) file (rows with an existing name are skipped)."""
+    now = datetime.now().isoformat()
+
+    def rows(reader):
         first = True
         for row in reader:
             if (
@@ -245,26 +261,45 @@ def import_merchants_txt(filepath):
                 continue
             if len(row) < 2:
                 continue
-            fields = (row + [""] * 8)[
-                :8
-            ]  # 8 fields: root, name, co, address, city, state, zip, notes
-            add_merchant_full(*fields)
+            # 8 fields: root, name, co, address, city, state, zip, notes
+            fields = [(v or "").strip() for v in (row + [""] * 8)[:8]]
+            yield (*fields, now)
+
+    conn = connect_db()
+    try:
+        # One connection and one transaction for the whole file
+        with open(filepath, encoding="utf-8") as f, conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO MerchantProcessors
+                    (root, name, co, address, city, state, zip, notes, date_added)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows(csv.reader(f)),
+            )
+    finally:
+        conn.close()
 
 
 def export_exclusions_txt(filepath):
     """Export all exclusions to a .txt (CSV) file."""
-    exclusions = get_all_exclusions_with_ids()
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["entity", "reason", "notes"])
-        for _, entity, reason, notes in exclusions:
-            writer.writerow([entity, reason, notes])
+    conn = connect_db()
+    try:
+        rows = conn.execute(
+            "SELECT entity, reason, notes FROM Exclusions ORDER BY entity COLLATE NOCASE"
+        )
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["entity", "reason", "notes"])
+            writer.writerows(rows)
+    finally:
+        conn.close()
 
 
 def import_exclusions_txt(filepath):
-    """Import exclusions from a .txt (CSV) file."""
-    with open(filepath, encoding="utf-8") as f:
-        reader = csv.reader(f)
+    """Import exclusions from a .txt (CSV) file (existing entities are skipped)."""
+    now = datetime.now().isoformat()
+
+    def rows(reader):
         first = True
         for row in reader:
             if first and row and row[0].lower() == "entity":
@@ -272,8 +307,21 @@ def import_exclusions_txt(filepath):
                 continue
             if len(row) < 1:
                 continue
-            fields = (row + [""] * 3)[:3]
-            add_exclusion(*fields)
+            fields = [(v or "").strip() for v in (row + [""] * 3)[:3]]
+            yield (*fields, now)
+
+    conn = connect_db()
+    try:
+        with open(filepath, encoding="utf-8") as f, conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO Exclusions
+                    (entity, reason, notes, date_added)
+                VALUES (?, ?, ?, ?)""",
+                rows(csv.reader(f)),
+            )
+    finally:
+        conn.close()
 
 
 # ---- Suggestions CRUD ----
@@ -316,9 +364,4 @@ def approve_suggestions(list_of_names):
 
 
 def delete_suggestions(list_of_names):
-    conn = connect_db()
-    c = conn.cursor()
-    for name in list_of_names:
-        c.execute("DELETE FROM Suggestions WHERE name = ?", (name.strip(),))
-    conn.commit()
-    conn.close()
+    _delete_where_in("Suggestions", "name", (name.strip() for name in list_of_names))
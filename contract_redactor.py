@@ -1,3 +1,4 @@
+import bisect
 import os
 import re
 from typing import List, Tuple, Dict, Optional
@@ -36,10 +37,30 @@ EIN_PATTERNS = [
     re.compile(r"\b\d{9}\b"),  # fallback if dash omitted
 ]
 
-
-def _words_by_line(page) -> Dict[Tuple[int, int], List[Tuple[float, float, float, float, str, int, int, int]]]:
-    """Group page.get_text('words') by (block_no, line_no)."""
-    words = page.get_text("words") or []
+# One alternation over every label, one named group per LABELS category, so a
+# single finditer over the joined line text finds all labels on that line.
+# Longer phrases go first so "routing number" wins over "routing".
+_LABEL_RE = re.compile(
+    "|".join(
+        f"(?P<{cat}>{'|'.join(sorted(pats, key=len, reverse=True))})"
+        for cat, pats in LABELS.items()
+    ),
+    re.I,
+)
+_MASKED_VALUE_RE = re.compile(r"[xX\*]{2,}\d{2,}$")
+
+
+def _words_by_line(
+    page, clip: Optional[Tuple[float, float, float, float]] = None
+) -> Dict[Tuple[int, int], List[Tuple[float, float, float, float, str, int, int, int]]]:
+    """Group page.get_text('words') by (block_no, line_no).
+
+    When ``clip`` is given, MuPDF only extracts words inside that region.
+    """
+    if clip is not None:
+        words = page.get_text("words", clip=fitz.Rect(*clip)) or []
+    else:
+        words = page.get_text("words") or []
     lines: Dict[Tuple[int, int], List[Tuple[float, float, float, float, str, int, int, int]]] = {}
     for w in words:
         # w: x0, y0, x1, y1, text, block_no, line_no, word_no
@@ -60,33 +81,53 @@ def _union_rect(rects: List[fitz.Rect]) -> Optional[fitz.Rect]:
     return r
 
 
+# Deletes ASCII digits; the length difference is the digit count (all in C).
+_DIGIT_DELETE = str.maketrans("", "", "0123456789")
+
+
 def _contains_digits(s: str, min_digits: int = 1) -> bool:
-    return sum(ch.isdigit() for ch in s) >= min_digits
+    return len(s) - len(s.translate(_DIGIT_DELETE)) >= min_digits
 
 
-def _match_any(patterns: List[str], text: str) -> bool:
-    tl = text.lower()
-    return any(re.search(p, tl, re.I) for p in patterns)
+def _label_right_edges(
+    line_words: List[Tuple[float, float, float, float, str, int, int, int]],
+) -> Dict[str, float]:
+    """Return {category: right-most x1 of any matching label word} for one line.
+
+    The words are joined into the line text and scanned once with ``_LABEL_RE``;
+    match ends are mapped back to word indexes via the words' start offsets.
+    """
+    starts: List[int] = []
+    pos = 0
+    for w in line_words:
+        starts.append(pos)
+        pos += len(w[4]) + 1
+    line_text = " ".join(w[4] for w in line_words)
+
+    edges: Dict[str, float] = {}
+    for m in _LABEL_RE.finditer(line_text):
+        idx = bisect.bisect_right(starts, m.end() - 1) - 1
+        x1 = line_words[idx][2]
+        cat = m.lastgroup
+        if cat is None:
+            continue
+        edges[cat] = max(edges.get(cat, x1), x1)
+    return edges
 
 
 def _collect_sensitive_runs(
     line_words: List[Tuple[float, float, float, float, str, int, int, int]],
-    label_patterns: List[str],
+    x1_label: Optional[float],
     min_digits_for_value: int,
     restrict_to_right_of_label: bool = True,
 ) -> List[fitz.Rect]:
     """Given line words, find sequences of words right of a label that look like values.
 
     Heuristics:
-    - Identify the right-most x1 of any label-match token(s) on the line.
-    - Then collect contiguous words to the right containing digits, x, or *.
+    - ``x1_label`` is the right-most x1 of the label token(s) on the line
+      (see ``_label_right_edges``); None means no label was found.
+    - Collect contiguous words to the right containing digits, x, or *.
     """
-    # locate label span x1
-    x1_label = None
-    for w in line_words:
-        text = w[4]
-        if _match_any(label_patterns, text):
-            x1_label = w[2] if x1_label is None else max(x1_label, w[2])
     rects: List[fitz.Rect] = []
     if restrict_to_right_of_label and x1_label is None:
         return rects
@@ -101,7 +142,7 @@ def _collect_sensitive_runs(
         if not t:
             continue
         token_has_value = _contains_digits(t, min_digits_for_value) or bool(
-            re.search(r"[xX\*]{2,}\d{2,}$", t)
+            _MASKED_VALUE_RE.search(t)
         )
         if token_has_value:
             current_run.append(fitz.Rect(x0, y0, x1, y1))
@@ -118,10 +159,17 @@ def _collect_sensitive_runs(
     return rects
 
 
-def _collect_ein_rects(line_words: List[Tuple[float, float, float, float, str, int, int, int]]) -> List[fitz.Rect]:
+def _collect_ein_rects(
+    line_words: List[Tuple[float, float, float, float, str, int, int, int]],
+    label_edges: Optional[Dict[str, float]] = None,
+) -> List[fitz.Rect]:
+    if label_edges is None:
+        label_edges = _label_right_edges(line_words)
     rects: List[fitz.Rect] = []
     # First try label-guided
-    rects.extend(_collect_sensitive_runs(line_words, LABELS["ein"], min_digits_for_value=9))
+    rects.extend(
+        _collect_sensitive_runs(line_words, label_edges.get("ein"), min_digits_for_value=9)
+    )
     if rects:
         return rects
     # Fallback: any EIN-looking token anywhere on the line
@@ -132,88 +180,133 @@ def _collect_ein_rects(line_words: List[Tuple[float, float, float, float, str, i
     return rects
 
 
-def _collect_bank_rects(line_words: List[Tuple[float, float, float, float, str, int, int, int]]) -> List[fitz.Rect]:
+def _collect_bank_rects(
+    line_words: List[Tuple[float, float, float, float, str, int, int, int]],
+    label_edges: Optional[Dict[str, float]] = None,
+) -> List[fitz.Rect]:
+    if label_edges is None:
+        label_edges = _label_right_edges(line_words)
     rects: List[fitz.Rect] = []
     # Routing numbers (typically 9 digits)
-    rects.extend(_collect_sensitive_runs(line_words, LABELS["routing"], min_digits_for_value=9))
+    rects.extend(
+        _collect_sensitive_runs(line_words, label_edges.get("routing"), min_digits_for_value=9)
+    )
     # Account numbers (variable length, but ensure >= 4 digits)
-    rects.extend(_collect_sensitive_runs(line_words, LABELS["account"], min_digits_for_value=4))
+    rects.extend(
+        _collect_sensitive_runs(line_words, label_edges.get("account"), min_digits_for_value=4)
+    )
     return rects
 
 
+def _mentions_mulligan(doc: fitz.Document, max_pages: int = 8) -> bool:
+    target = "mulligan funding"
+    for i in range(min(max_pages, len(doc))):
+        if target in (doc[i].get_text() or "").lower():
+            return True
+    return False
+
+
 def is_mulligan_contract(input_pdf: str, max_pages: int = 8) -> bool:
     """Heuristic: return True if the PDF text mentions 'Mulligan Funding' in the first N pages."""
     doc = fitz.open(input_pdf)
     try:
-        pages = min(max_pages, len(doc))
-        target = "mulligan funding"
-        for i in range(pages):
-            text = (doc[i].get_text() or "").lower()
-            if target in text:
-                return True
-        return False
+        return _mentions_mulligan(doc, max_pages)
     finally:
         doc.close()
 
 
-def redact_mulligan_contract(input_pdf: str, output_pdf: Optional[str] = None, page_number: int = 5) -> Dict[str, int]:
+def redact_mulligan_contract(
+    input_pdf: str,
+    output_pdf: Optional[str] = None,
+    page_number: int = 5,
+    clip: Optional[Tuple[float, float, float, float]] = None,
+) -> Dict[str, int]:
     """Redact EIN and bank routing/account numbers on a specific page (default page 5).
 
+    ``clip`` optionally restricts text extraction to an (x0, y0, x1, y1) region in
+    PDF points, e.g. the form area of the page; by default the whole page is scanned.
+
     Returns a summary dict: {"page_index": idx, "redactions": count}
     """
     doc = fitz.open(input_pdf)
     try:
-        idx = max(0, page_number - 1)
-        if idx >= len(doc):
-            raise ValueError(f"PDF has only {len(doc)} page(s); page {page_number} not found")
-        page = doc[idx]
-
-        lines = _words_by_line(page)
-        target_rects: List[fitz.Rect] = []
-
-        # Pass 1: line-guided by labels
-        for key, line_words in lines.items():
-            # collect EINs
-            target_rects.extend(_collect_ein_rects(line_words))
-            # collect bank routing / account
-            target_rects.extend(_collect_bank_rects(line_words))
-
-        # Deduplicate overlapping rects
-        merged: List[fitz.Rect] = []
-        for r in target_rects:
-            placed = False
-            for i, mr in enumerate(merged):
-                if mr.intersects(r) or mr.contains(r) or r.contains(mr):
-                    merged[i] = mr | r
-                    placed = True
-                    break
-            if not placed:
-                merged.append(r)
-
-        # Add redactions
-        for r in merged:
-            page.add_redact_annot(r, fill=(0, 0, 0))
-        if merged:
-            page.apply_redactions()
-
-        # Save
-        if not output_pdf:
-            root, ext = os.path.splitext(input_pdf)
-            output_pdf = f"{root} - Redacted{ext}"
-        doc.save(output_pdf)
-        return {"page_index": idx, "redactions": len(merged)}
+        return _redact_open_doc(doc, input_pdf, output_pdf, page_number, clip)
     finally:
         doc.close()
 
 
-def redact_if_mulligan(input_pdf: str, output_pdf: Optional[str] = None, page_number: int = 5) -> Optional[Dict[str, int]]:
+def _redact_open_doc(
+    doc: fitz.Document,
+    input_pdf: str,
+    output_pdf: Optional[str],
+    page_number: int,
+    clip: Optional[Tuple[float, float, float, float]],
+) -> Dict[str, int]:
+    """Redact the target page of an already open ``doc`` and save it to ``output_pdf``.
+
+    ``input_pdf`` only names the default output (``<input> - Redacted.pdf``). Raises
+    ValueError when the document has fewer than ``page_number`` pages.
+    """
+    idx = max(0, page_number - 1)
+    if idx >= len(doc):
+        raise ValueError(f"PDF has only {len(doc)} page(s); page {page_number} not found")
+    page = doc[idx]
+
+    lines = _words_by_line(page, clip=clip)
+    target_rects: List[fitz.Rect] = []
+
+    # Pass 1: line-guided by labels
+    for key, line_words in lines.items():
+        label_edges = _label_right_edges(line_words)
+        # collect EINs
+        target_rects.extend(_collect_ein_rects(line_words, label_edges))
+        # collect bank routing / account
+        target_rects.extend(_collect_bank_rects(line_words, label_edges))
+
+    # Deduplicate overlapping rects
+    merged: List[fitz.Rect] = []
+    for r in target_rects:
+        placed = False
+        for i, mr in enumerate(merged):
+            if mr.intersects(r) or mr.contains(r) or r.contains(mr):
+                merged[i] = mr | r
+                placed = True
+                break
+        if not placed:
+            merged.append(r)
+
+    # Add redactions
+    for r in merged:
+        page.add_redact_annot(r, fill=(0, 0, 0))
+    if merged:
+        page.apply_redactions()
+
+    # Save
+    if not output_pdf:
+        root, ext = os.path.splitext(input_pdf)
+        output_pdf = f"{root} - Redacted{ext}"
+    doc.save(output_pdf)
+    return {"page_index": idx, "redactions": len(merged)}
+
+
+def redact_if_mulligan(
+    input_pdf: str,
+    output_pdf: Optional[str] = None,
+    page_number: int = 5,
+    clip: Optional[Tuple[float, float, float, float]] = None,
+) -> Optional[Dict[str, int]]:
     """If the given PDF appears to be a Mulligan Funding contract, redact the target page.
 
-    Returns summary dict if redacted, otherwise None.
+    Returns summary dict if redacted, otherwise None (also when the PDF is shorter
+    than page_number). The PDF is opened once for both the check and the redaction.
     """
-    if is_mulligan_contract(input_pdf):
-        return redact_mulligan_contract(input_pdf, output_pdf=output_pdf, page_number=page_number)
-    return None
+    doc = fitz.open(input_pdf)
+    try:
+        if page_number > len(doc) or not _mentions_mulligan(doc):
+            return None
+        return _redact_open_doc(doc, input_pdf, output_pdf, page_number, clip)
+    finally:
+        doc.close()
 
 
 # ---------------- CLI ----------------
@@ -226,6 +319,15 @@ def main(argv=None):
     parser.add_argument("inputs", nargs="+", help="PDF file(s) to redact")
     parser.add_argument("-p", "--page", type=int, default=5, help="1-based page number (default: 5)")
     parser.add_argument("-o", "--output-dir", default=None, help="Directory to write redacted files (defaults beside input)")
+    parser.add_argument(
+        "-c",
+        "--clip",
+        type=float,
+        nargs=4,
+        metavar=("X0", "Y0", "X1", "Y1"),
+        default=None,
+        help="Only scan this page region (PDF points) for sensitive fields",
+    )
     parser.add_argument("-q", "--quiet", action="store_true", help="Suppress per-file logs")
     args = parser.parse_args(argv)
 
@@ -242,7 +344,9 @@ def main(argv=None):
                 out = os.path.join(args.output_dir, f"{name} - Redacted{ext}")
             else:
                 out = None
-            summary = redact_mulligan_contract(inp, output_pdf=out, page_number=args.page)
+            summary = redact_mulligan_contract(
+                inp, output_pdf=out, page_number=args.page, clip=args.clip
+            )
             ok += 1
             if not args.quiet:
                 print(f"✔ {inp} -> redactions={summary['redactions']} (page index {summary['page_index']})")
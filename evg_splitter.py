@@ -1,10 +1,29 @@
+import bisect
+import hashlib
+import json
 import os
 import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Tuple, TypedDict
 
 import fitz  # PyMuPDF
 import pytesseract
-from pdf2image import convert_from_path
+from PIL import Image
+
+try:
+    import tesserocr  # in-process Tesseract: the language model loads once
+except ImportError:
+    tesserocr = None
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = np = None  # type: ignore[assignment]
 
 # --- CATEGORY KEYWORDS ---
 UCC_KEYWORDS = [
@@ -38,6 +57,20 @@ BANK_STATEMENT_KEYWORDS = [
 
 # --- HEURISTICS ---
 CONTRACT_PAGE_COUNT = 10
+
+# --- OCR FALLBACK ---
+OCR_DPI = 200
+# Max pages rendered ahead of Tesseract (bounds memory on long scanned runs)
+OCR_BATCH_PAGES = 16
+# Extra Tesseract flags, e.g. "--oem 1 --psm 6"; empty keeps Tesseract defaults
+OCR_CONFIG = os.getenv("EVG_OCR_CONFIG", "")
+# Adaptive-threshold pages to black/white before OCR (needs opencv-python)
+OCR_BINARIZE = os.getenv("EVG_OCR_BINARIZE", "1") != "0"
+
+# The Recovery.pdf copy is hard-linked to the input when both are on the same
+# filesystem (no data is written); EVG_LINK_RECOVERY=0 always writes a real copy
+LINK_RECOVERY_COPY = os.getenv("EVG_LINK_RECOVERY", "1") != "0"
+
 UNIQUE_NOTE_KEYWORDS = [
     "advised",
     "communicated",
@@ -92,14 +125,68 @@ EMAIL_EXCLUSION_PATTERNS = [
     "@trustfi.com",
 ]
 
+# --- PAGE TEXT CACHE ---
+# Opt-in (EVG_TEXT_CACHE=1): extracted/OCR'd page text, page types and the merchant
+# name are cached per input file so a re-run on the same PDF skips extraction and
+# OCR. The files hold the full statement/contract text in plain JSON, so they are
+# pruned by age and total size after every write.
+PAGE_CACHE_ENABLED = os.getenv("EVG_TEXT_CACHE", "0") == "1"
+PAGE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ap3tech", "pdfcache")
+PAGE_CACHE_MAX_AGE_DAYS = float(os.getenv("EVG_TEXT_CACHE_MAX_AGE_DAYS", "14"))
+PAGE_CACHE_MAX_MB = float(os.getenv("EVG_TEXT_CACHE_MAX_MB", "200"))
+
+# --- PRECOMPILED PATTERNS ---
+EMAIL_RE = re.compile(r"[\w.\-]+@[\w.\-]+")
+PHONE_RE = re.compile(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+NON_DIGIT_RE = re.compile(r"\D")
+BUSINESS_NAME_RE = re.compile(r"Business Name:\s*([^\n]+)", re.IGNORECASE)
+DATE_TIME_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})[\s\n]+(\d{1,2}:\d{2}\s?(AM|PM|am|pm))")
+UNSAFE_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+NON_ALPHA_RE = re.compile(r"[^a-zA-Z]")
+
+
+def _keyword_alternation(keywords):
+    """Escape keywords into one lowercase regex alternation, longest first."""
+    return "|".join(
+        re.escape(k.lower()) for k in sorted(keywords, key=len, reverse=True)
+    )
+
+
+# Page categories in classify_page priority order, keywords lowercased once.
+# Each keyword is tested on its own so overlapping keywords ("td bank",
+# "bank of america") all count toward a category's hits.
+PAGE_CATEGORY_KEYWORDS = {
+    cat: tuple(k.lower() for k in kws)
+    for cat, kws in (
+        ("client_notes_raw", CLIENT_NOTE_KEYWORDS),
+        ("ucc", UCC_KEYWORDS),
+        ("contract", CONTRACT_KEYWORDS),
+        ("bank_statements", BANK_STATEMENT_KEYWORDS),
+    )
+}
+UNIQUE_NOTE_RE = re.compile(_keyword_alternation(UNIQUE_NOTE_KEYWORDS))
+# Any pattern found inside the address excludes it (this covers suffix matches too)
+EMAIL_EXCLUSION_RE = re.compile(_keyword_alternation(EMAIL_EXCLUSION_PATTERNS))
+EXCLUDE_NOTE_RE = re.compile(_keyword_alternation(EXCLUDE_NOTE_PHRASES))
+
 # --- HEADERS TO IGNORE IN HIGHLIGHTING ---
 HEADER_LINES = ["POSSIBLE EMAIL ADDRESSES:", "PHONE NUMBERS:", "CLIENT NOTES:"]
 
+
 # --- COLOR & STYLE RULES ---
-COLOR_RULES = [
+class ColorRule(TypedDict):
+    name: str
+    pattern: re.Pattern[str]
+    color: Tuple[float, float, float]
+    bold: bool
+    italic: bool
+    font_size: int
+
+
+COLOR_RULES: List[ColorRule] = [
     {
         "name": "lawyer",
-        "pattern": re.compile(r"\\b(atty|aty|attorney|law|lawyer)\\b", re.I),
+        "pattern": re.compile(r"\b(atty|aty|attorney|law|lawyer)\b", re.I),
         "color": (1, 0, 0),  # Red
         "bold": True,
         "italic": True,
@@ -119,7 +206,7 @@ COLOR_RULES = [
     {
         "name": "money",
         "pattern": re.compile(
-            r"(\$\s?\d{1,3}(?:,\d{3})*(?:\.\d{2})?|\\b\d{1,3}(?:,\d{3})*\.\d{2}\b)"
+            r"(\$\s?\d{1,3}(?:,\d{3})*(?:\.\d{2})?|\b\d{1,3}(?:,\d{3})*\.\d{2}\b)"
         ),
         "color": (0, 0.5, 0),  # Green
         "bold": True,
@@ -128,7 +215,7 @@ COLOR_RULES = [
     },
     {
         "name": "drc",
-        "pattern": re.compile(r"\\bDRC\\b", re.I),
+        "pattern": re.compile(r"\bDRC\b", re.I),
         "color": (0, 0, 1),  # Blue
         "bold": True,
         "italic": True,
@@ -137,6 +224,19 @@ COLOR_RULES = [
 ]
 
 
+# All color rules in one alternation: at any position the earliest rule in
+# COLOR_RULES wins, matching the old per-rule nearest-match scan.
+COLOR_RULES_RE = re.compile(
+    "|".join(
+        f"(?P<{rule['name']}>"
+        + ("(?i:" if rule["pattern"].flags & re.I else "(?:")
+        + f"{rule['pattern'].pattern}))"
+        for rule in COLOR_RULES
+    )
+)
+COLOR_RULES_BY_NAME = {rule["name"]: rule for rule in COLOR_RULES}
+
+
 def colorize_line(line):
     """
     Apply color, bold, italic, and font size to keywords/matches in a given line.
@@ -144,40 +244,38 @@ def colorize_line(line):
     """
     results = []
     i = 0
-    while i < len(line):
-        match_obj = None
-        match_rule = None
-        for rule in COLOR_RULES:
-            match = rule["pattern"].search(line, i)
-            if match and (match_obj is None or match.start() < match_obj.start()):
-                match_obj = match
-                match_rule = rule
-        if match_obj and match_obj.start() > i:
+    for match in COLOR_RULES_RE.finditer(line):
+        if match.start() > i:
             # Non-matching part before (add None for keyword_type)
-            results.append((line[i : match_obj.start()], None, False, False, 10, None))
-            i = match_obj.start()
-        if match_obj:
-            results.append(
-                (
-                    line[match_obj.start() : match_obj.end()],
-                    match_rule["color"],
-                    match_rule["bold"],
-                    match_rule["italic"],
-                    match_rule["font_size"],
-                    match_rule["name"],  # <--- the type ("comms", "lawyer", etc)
-                )
+            results.append((line[i : match.start()], None, False, False, 10, None))
+        rule = COLOR_RULES_BY_NAME[match.lastgroup]
+        results.append(
+            (
+                match.group(),
+                rule["color"],
+                rule["bold"],
+                rule["italic"],
+                rule["font_size"],
+                rule["name"],  # <--- the type ("comms", "lawyer", etc)
             )
-            i = match_obj.end()
-        else:
-            results.append((line[i:], None, False, False, 10, None))
-            break
+        )
+        i = match.end()
+    if i < len(line):
+        results.append((line[i:], None, False, False, 10, None))
     return results
 
 
 # --- MAIN SPLITTING FUNCTION ---
 def split_recovery_pdf(filepath, output_dir=None):
     doc = fitz.open(filepath)
-    merchant_name = extract_merchant_name(doc)
+    digest = file_md5(filepath) if PAGE_CACHE_ENABLED else None
+    cache = load_page_cache(digest) if digest else {}
+    cache_dirty = False
+
+    merchant_name = cache.get("merchant_name") or extract_merchant_name(doc)
+    if merchant_name and merchant_name != cache.get("merchant_name"):
+        cache["merchant_name"] = merchant_name
+        cache_dirty = True
     if not merchant_name:
         merchant_name = f"UnknownMerchant_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
@@ -195,16 +293,26 @@ def split_recovery_pdf(filepath, output_dir=None):
         "other": [],
     }
 
+    # Each page's text is extracted once (or loaded from the cache) and reused by
+    # the contract search, classification, arbitration check and notes parsing.
+    # JSON object keys are strings, hence str(i) lookups into the cache
+    cached_texts = cache.setdefault("texts", {})
+    page_texts = []
+    for i, page in enumerate(doc):
+        text = cached_texts.get(str(i))
+        page_texts.append(text if text is not None else page.get_text())
+    page_texts_lower = [text.lower() for text in page_texts]
+
     contract_start = next(
         (
             i
-            for i, page in enumerate(doc)
-            if "revenue based financing agreement" in page.get_text().lower()
+            for i, text in enumerate(page_texts_lower)
+            if "revenue based financing agreement" in text
         ),
         None,
     )
     contract_pages = (
-        list(range(contract_start, contract_start + 10))
+        list(range(contract_start, min(contract_start + CONTRACT_PAGE_COUNT, len(doc))))
         if contract_start is not None
         else []
     )
@@ -212,27 +320,54 @@ def split_recovery_pdf(filepath, output_dir=None):
     recovery_copy_path = os.path.join(
         save_dir, f"{title_case_filename(merchant_name)} Recovery.pdf"
     )
-    save_pages_to_pdf(doc, list(range(len(doc))), recovery_copy_path)
-
-    excluded_pages = set(contract_pages)
-
-    for i, page in enumerate(doc):
-        if i in excluded_pages:
-            continue
-        text = page.get_text()
-        if not text.strip():
-            image = convert_from_path(filepath, first_page=i + 1, last_page=i + 1)[0]
-            text = pytesseract.image_to_string(image)
-        text = text.lower()
-        if "ach works" in text and (
-            "employee system" in text
-            or "employeesystem" in text
-            or "employee\nsystem" in text
-        ):
-            categorized_pages["transaction_history"].append(i)
-            continue
-        page_type = classify_page(text)
-        categorized_pages[page_type].append(i)
+    # The recovery copy is the whole input file, so link or copy the bytes directly
+    link_or_copy(filepath, recovery_copy_path)
+
+    # Per-page 0/1 markers indexed by page number
+    excluded_pages = bytearray(len(doc))
+    for i in contract_pages:
+        excluded_pages[i] = 1
+
+    cached_types = cache.setdefault("page_types", {})
+    page_types = {}
+
+    def classify_cached(i):
+        nonlocal cache_dirty
+        page_type = cached_types.get(str(i))
+        if page_type not in categorized_pages:
+            page_type = cached_types[str(i)] = _page_type(page_texts_lower[i])
+            cache_dirty = True
+        page_types[i] = page_type
+
+    ocr_pages = [
+        i
+        for i, text in enumerate(page_texts)
+        if not excluded_pages[i] and not text.strip()
+    ]
+    # Pages without a text layer are OCR'd on a worker thread while the
+    # text-layer pages are classified here. The worker renders from its own
+    # document handle and this thread makes no PyMuPDF calls until it is done.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        ocr_future = pool.submit(ocr_pages_text, filepath, ocr_pages)
+        skip = bytearray(excluded_pages)
+        for i in ocr_pages:
+            skip[i] = 1
+        for i in range(len(page_texts)):
+            if not skip[i]:
+                classify_cached(i)
+        for i, text in ocr_future.result().items():
+            page_texts[i] = text
+            page_texts_lower[i] = text.lower()
+            classify_cached(i)
+    for i in sorted(page_types):
+        categorized_pages[page_types[i]].append(i)
+
+    for i, text in enumerate(page_texts):
+        if cached_texts.get(str(i)) != text:
+            cached_texts[str(i)] = text
+            cache_dirty = True
+    if digest and cache_dirty:
+        save_page_cache(digest, cache)
 
     bank_pages = categorized_pages["bank_statements"]
     if bank_pages:
@@ -242,7 +377,7 @@ def split_recovery_pdf(filepath, output_dir=None):
         categorized_pages["bank_statements"] = full_bank_range
 
     if contract_pages:
-        last_page_text = doc[contract_pages[-1]].get_text().lower()
+        last_page_text = page_texts_lower[contract_pages[-1]]
         if "class action waiver" in last_page_text and "arbitration" in last_page_text:
             categorized_pages["contract"] = contract_pages
         else:
@@ -251,10 +386,10 @@ def split_recovery_pdf(filepath, output_dir=None):
             save_pages_to_pdf(doc, contract_pages, pdf_path)
 
     categorized_pages["ucc"] = [
-        p for p in categorized_pages["ucc"] if p not in excluded_pages
+        p for p in categorized_pages["ucc"] if not excluded_pages[p]
     ]
 
-    known_pages = set()
+    known_pages = bytearray(len(doc))
     for cat in [
         "contract",
         "ucc",
@@ -262,8 +397,9 @@ def split_recovery_pdf(filepath, output_dir=None):
         "bank_statements",
         "transaction_history",
     ]:
-        known_pages.update(categorized_pages[cat])
-    categorized_pages["other"] = [i for i in range(len(doc)) if i not in known_pages]
+        for i in categorized_pages[cat]:
+            known_pages[i] = 1
+    categorized_pages["other"] = [i for i in range(len(doc)) if not known_pages[i]]
 
     for category, pages in categorized_pages.items():
         if not pages:
@@ -277,31 +413,25 @@ def split_recovery_pdf(filepath, output_dir=None):
         parsed_notes = []
         emails = set()
         for i in client_note_pages:
-            text = doc[i].get_text()
-            lines = text.splitlines()
+            lines = page_texts[i].splitlines()
             for j, line in enumerate(lines):
                 line = line.encode("ascii", "ignore").decode("ascii")
-                email_matches = re.findall(r"[\w\.-]+@[\w\.-]+", line)
+                email_matches = EMAIL_RE.findall(line)
                 for email in email_matches:
-                    if not any(
-                        email.lower().endswith(skip)
-                        for skip in EMAIL_EXCLUSION_PATTERNS
-                    ) and not any(
-                        skip in email.lower() for skip in EMAIL_EXCLUSION_PATTERNS
-                    ):
-                        emails.add(email.lower())
-                if any(keyword in line.lower() for keyword in UNIQUE_NOTE_KEYWORDS):
-                    if not any(ex in line.lower() for ex in EXCLUDE_NOTE_PHRASES):
+                    email = email.lower()
+                    if not EMAIL_EXCLUSION_RE.search(email):
+                        emails.add(email)
+                line_lower = line.lower()
+                if UNIQUE_NOTE_RE.search(line_lower):
+                    if not EXCLUDE_NOTE_RE.search(line_lower):
                         buffer = "\n".join(lines[j : j + 3])
                         timestamp = extract_datetime_from_text(buffer)
                         parsed_notes.append(f"{timestamp} - {line.strip()}")
         phones = set()
         for note in parsed_notes:
-            note_phone_matches = re.findall(
-                r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", note
-            )
+            note_phone_matches = PHONE_RE.findall(note)
             for match in note_phone_matches:
-                digits = re.sub(r"\D", "", match)
+                digits = NON_DIGIT_RE.sub("", match)
                 if len(digits) == 10:
                     phones.add(digits)
         unique_digits = sorted(phones)
@@ -325,6 +455,251 @@ def split_recovery_pdf(filepath, output_dir=None):
     return save_dir
 
 
+def link_or_copy(src, dst):
+    """Hard-link src to dst (falling back to a byte copy); no-op if dst is src."""
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return
+        os.remove(dst)
+    if LINK_RECOVERY_COPY:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _page_type(text):
+    """Categorize one page's lowercased text, including ACH Works transaction history."""
+    if "ach works" in text and (
+        "employee system" in text
+        or "employeesystem" in text
+        or "employee\nsystem" in text
+    ):
+        return "transaction_history"
+    return classify_page(text)
+
+
+def file_md5(filepath):
+    """Return the hex MD5 of a file, read in 1 MiB chunks."""
+    h = hashlib.md5()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _hash_code(h, code):
+    """Feed a function's bytecode, names and constants (recursively) into h."""
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(h, const)
+        elif isinstance(const, frozenset):
+            h.update(repr(sorted(const, key=repr)).encode("utf-8"))
+        else:
+            h.update(repr(const).encode("utf-8"))
+
+
+@lru_cache(maxsize=1)
+def page_cache_key():
+    """Fingerprint of everything that shapes a cache entry.
+
+    Covers the OCR settings and engine, the page classifier (keyword lists plus the
+    code of _page_type/classify_page) and merchant-name extraction, so changing any
+    of them misses the old entries instead of serving stale text or page types.
+    """
+    h = hashlib.md5()
+    settings = {
+        "ocr_dpi": OCR_DPI,
+        "ocr_config": OCR_CONFIG,
+        "ocr_binarize": OCR_BINARIZE and cv2 is not None,
+        "tesserocr": tesserocr is not None,
+        "keywords": PAGE_CATEGORY_KEYWORDS,
+        "business_name_re": BUSINESS_NAME_RE.pattern,
+        "unsafe_filename_re": UNSAFE_FILENAME_RE.pattern,
+    }
+    h.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    for fn in (_page_type, classify_page, extract_merchant_name, sanitize_filename):
+        _hash_code(h, getattr(fn, "__wrapped__", fn).__code__)
+    return h.hexdigest()[:16]
+
+
+def _page_cache_path(digest):
+    return os.path.join(PAGE_CACHE_DIR, f"{digest}-{page_cache_key()}.json")
+
+
+def load_page_cache(digest):
+    """Load the cached page data for a PDF digest ({} when missing or unreadable)."""
+    path = _page_cache_path(digest)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_page_cache(digest, data):
+    """Write the page cache atomically; a failed write only costs the next run."""
+    path = _page_cache_path(digest)
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+    prune_page_cache()
+
+
+def prune_page_cache():
+    """Delete cache files older than the age limit, then the oldest until under the size cap."""
+    try:
+        entries = [
+            e for e in os.scandir(PAGE_CACHE_DIR) if e.is_file() and e.name.endswith(".json")
+        ]
+    except OSError:
+        return
+    cutoff = datetime.now().timestamp() - PAGE_CACHE_MAX_AGE_DAYS * 86400
+    budget = PAGE_CACHE_MAX_MB * 1024 * 1024
+    keep = []
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        if st.st_mtime < cutoff:
+            _remove_quietly(entry.path)
+        else:
+            keep.append((st.st_mtime, st.st_size, entry.path))
+    # Newest first; everything past the size budget goes
+    keep.sort(reverse=True)
+    total = 0
+    for _, size, path in keep:
+        total += size
+        if total > budget:
+            _remove_quietly(path)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _contiguous_runs(page_indices, max_len):
+    """Group page indices into runs of consecutive pages, at most max_len long."""
+    runs = []
+    for i in sorted(page_indices):
+        if runs and i == runs[-1][-1] + 1 and len(runs[-1]) < max_len:
+            runs[-1].append(i)
+        else:
+            runs.append([i])
+    return runs
+
+
+def _tesserocr_options(config):
+    """Translate pytesseract-style flags into PyTessBaseAPI kwargs and variables."""
+    kwargs, variables = {}, {}
+    args = config.split()
+    for flag, value in zip(args, args[1:]):
+        if flag == "--psm":
+            kwargs["psm"] = int(value)
+        elif flag == "--oem":
+            kwargs["oem"] = int(value)
+        elif flag == "-c" and "=" in value:
+            name, _, val = value.partition("=")
+            variables[name] = val
+    return kwargs, variables
+
+
+def _render_page(doc, page_index):
+    # Grayscale is all Tesseract uses, and a third of the RGB pixel data
+    pix = doc[page_index].get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY, alpha=False)
+    return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+def _preprocess_for_ocr(image):
+    """Binarize a grayscale page with an adaptive threshold when OpenCV is available."""
+    if cv2 is None or not OCR_BINARIZE:
+        return image
+    arr = cv2.adaptiveThreshold(
+        np.asarray(image),
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        31,
+        10,
+    )
+    return Image.fromarray(arr)
+
+
+def ocr_pages_text(filepath, page_indices):
+    """OCR the given 0-based pages of a PDF and return {page_index: text}.
+
+    Pages are rendered with PyMuPDF and recognized on a thread pool. With
+    tesserocr installed each worker keeps one in-process Tesseract instance;
+    otherwise every page goes through a pytesseract subprocess.
+    """
+    if not page_indices:
+        return {}
+    workers = os.cpu_count() or 1
+    local = threading.local()
+    apis = []
+    apis_lock = threading.Lock()
+
+    def recognize(image):
+        image = _preprocess_for_ocr(image)
+        if tesserocr is None:
+            return pytesseract.image_to_string(image, config=OCR_CONFIG)
+        api = getattr(local, "api", None)
+        if api is None:
+            kwargs, variables = _tesserocr_options(OCR_CONFIG)
+            api = local.api = tesserocr.PyTessBaseAPI(**kwargs)
+            for name, value in variables.items():
+                api.SetVariable(name, value)
+            with apis_lock:
+                apis.append(api)
+        api.SetImage(image)
+        return api.GetUTF8Text()
+
+    texts = {}
+    pending = {}
+    pages = sorted(page_indices)
+    try:
+        with fitz.open(filepath) as doc, ThreadPoolExecutor(max_workers=workers) as pool:
+            for start in range(0, len(pages), OCR_BATCH_PAGES):
+                # Render the next batch while the previous one is recognized, then
+                # wait for that previous batch so at most two are held in memory
+                batch = {
+                    i: pool.submit(recognize, _render_page(doc, i))
+                    for i in pages[start : start + OCR_BATCH_PAGES]
+                }
+                texts.update((i, fut.result()) for i, fut in pending.items())
+                pending = batch
+            texts.update((i, fut.result()) for i, fut in pending.items())
+    finally:
+        for api in apis:
+            api.End()
+    return texts
+
+
+_FONTS: Dict[str, fitz.Font] = {}
+
+
+def _font(font_name):
+    """Return a cached fitz.Font so text widths are measured without re-resolving it."""
+    font = _FONTS.get(font_name)
+    if font is None:
+        font = _FONTS[font_name] = fitz.Font(font_name)
+    return font
+
+
 def render_colored_pdf(lines, output_path):
     doc = fitz.open()
     margin = 72
@@ -355,21 +730,25 @@ def render_colored_pdf(lines, output_path):
                     eff_size = font_size
                 font_name = "helv"
                 run.append((text, color, bold, italic, eff_size, font_name))
-        x = margin
+        # Adjacent spans that render identically are drawn with one insert_text
+        spans = []
         for text, color, bold, italic, font_size, font_name in run:
-            if color is None:
-                color = (0, 0, 0)
+            style = (color or (0, 0, 0), font_size, font_name)
+            if spans and spans[-1][1] == style:
+                spans[-1][0] += text
+            else:
+                spans.append([text, style])
+        x = margin
+        for text, (color, font_size, font_name) in spans:
+            text_width = _font(font_name).text_length(text, fontsize=font_size)
             # Wrap text if it exceeds line width
-            if (
-                fitz.get_text_length(text, fontsize=font_size, fontname=font_name) + x
-                > margin + max_width
-            ):
+            if text_width + x > margin + max_width:
                 y += font_size + 2
                 x = margin
             page.insert_text(
                 (x, y), text, fontsize=font_size, fontname=font_name, color=color
             )
-            x += fitz.get_text_length(text, fontsize=font_size, fontname=font_name)
+            x += text_width
         y += 16 if not is_header else 20
         if y > height - margin:
             page = doc.new_page()
@@ -380,23 +759,28 @@ def render_colored_pdf(lines, output_path):
 
 def extract_merchant_name(doc):
     first_page_text = doc[0].get_text()
-    match = re.search(r"Business Name:\s*([^\n]+)", first_page_text, re.IGNORECASE)
+    match = BUSINESS_NAME_RE.search(first_page_text)
     if match:
         return sanitize_filename(match.group(1).strip())
     return None
 
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(name):
-    return re.sub(r'[\\/*?:"<>|]', "", name)
+    return UNSAFE_FILENAME_RE.sub("", name)
+
 
+FILENAME_ACRONYMS = frozenset({"LLC", "INC", "CORP", "DBA", "NYC", "USA", "LLP", "TV"})
 
+
+# Called for every output filename of a split with the same merchant name
+@lru_cache(maxsize=1024)
 def title_case_filename(name):
-    acronyms = {"LLC", "INC", "CORP", "DBA", "NYC", "USA", "LLP", "TV"}
     words = name.split()
     result = []
     for word in words:
-        clean = re.sub(r"[^a-zA-Z]", "", word)
-        if clean.upper() in acronyms:
+        clean = NON_ALPHA_RE.sub("", word)
+        if clean.upper() in FILENAME_ACRONYMS:
             result.append(word.upper())
         else:
             result.append(word.capitalize())
@@ -405,14 +789,15 @@ def title_case_filename(name):
 
 def classify_page(text):
     text = text.lower()
-    if any(term in text for term in CLIENT_NOTE_KEYWORDS):
+    keywords = PAGE_CATEGORY_KEYWORDS
+    if any(k in text for k in keywords["client_notes_raw"]):
         return "client_notes_raw"
-    if any(k in text for k in UCC_KEYWORDS):
+    if any(k in text for k in keywords["ucc"]):
         return "ucc"
-    contract_hits = sum(1 for k in CONTRACT_KEYWORDS if k in text)
+    contract_hits = sum(1 for k in keywords["contract"] if k in text)
     if contract_hits >= 1:
         return "contract"
-    bank_hits = sum(1 for k in BANK_STATEMENT_KEYWORDS if k in text)
+    bank_hits = sum(1 for k in keywords["bank_statements"] if k in text)
     if bank_hits >= 2:
         return "bank_statements"
     return "other"
@@ -420,19 +805,18 @@ def classify_page(text):
 
 def save_pages_to_pdf(doc, page_numbers, output_path):
     new_doc = fitz.open()
-    for page_num in sorted(page_numbers):
-        new_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
+    # One insert_pdf call per run of consecutive pages
+    for run in _contiguous_runs(page_numbers, len(doc)):
+        new_doc.insert_pdf(doc, from_page=run[0], to_page=run[-1])
     new_doc.save(output_path)
     new_doc.close()
 
 
 def extract_datetime_from_text(text):
-    match = re.search(
-        r"(\d{1,2}/\d{1,2}/\d{4})[\s\n]+(\d{1,2}:\d{2}\s?(AM|PM|am|pm))", text
-    )
+    match = DATE_TIME_RE.search(text)
     if match:
         return f"{match.group(1)}"
-    match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", text)
+    match = DATE_PATTERN.search(text)
     if match:
         return match.group(1)
     return ""
@@ -449,6 +833,8 @@ HIGHLIGHT_KEYWORDS = [
     "received",
 ]
 
+HIGHLIGHT_RE = re.compile(_keyword_alternation(HIGHLIGHT_KEYWORDS))
+
 DATE_PATTERN = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
 
 
@@ -474,13 +860,16 @@ def highlight_notes_in_pdf(doc, page_num):
         # SKIP HEADER LINES
         if line.strip().upper() in HEADER_LINES:
             continue
-        if any(kw in line.lower() for kw in HIGHLIGHT_KEYWORDS):
-            start = max([d for d in date_lines if d <= i], default=0)
-            end = next((d for d in date_lines if d > i), len(lines))
+        if HIGHLIGHT_RE.search(line.lower()):
+            # Nearest date line at or above i, and the next one below it
+            pos = bisect.bisect_right(date_lines, i)
+            start = date_lines[pos - 1] if pos else 0
+            end = date_lines[pos] if pos < len(date_lines) else len(lines)
             highlight_ranges.append((start, end))
 
+    # Several keyword lines in one dated entry share a range; annotate each line once
+    highlighted_indices = set()
     for start, end in highlight_ranges:
-        highlighted_indices = set()  # Track lines we've highlighted this pass
         for i in range(start, end):
             if i in highlighted_indices:
                 continue
@@ -529,6 +918,14 @@ def _discover_pdfs(paths, recursive: bool = False):
     return uniq
 
 
+def _split_one(filepath, output_dir):
+    """Split one file for the CLI; returns (output dir, error message or None)."""
+    try:
+        return split_recovery_pdf(filepath, output_dir=output_dir), None
+    except Exception as e:
+        return None, str(e)  # plain text, so it crosses the process boundary
+
+
 def main(argv=None):
     import argparse
     import sys
@@ -560,6 +957,13 @@ def main(argv=None):
         action="store_true",
         help="Suppress per-file success messages",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Split this many files in parallel worker processes (default: 1)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -571,15 +975,29 @@ def main(argv=None):
 
     ok = 0
     fail = 0
-    for f in files:
-        try:
-            outdir = split_recovery_pdf(f, output_dir=args.output)
-            ok += 1
-            if not args.quiet:
-                print(f"✔ Split: {os.path.basename(f)} -> {outdir}")
-        except Exception as e:
-            fail += 1
-            print(f"✖ Error processing {f}: {e}", file=sys.stderr)
+    outputs = [args.output] * len(files)
+    jobs = max(1, min(args.jobs, len(files)))
+    pool = None
+    if jobs == 1:
+        results = map(_split_one, files, outputs)
+    else:
+        # PyMuPDF is not thread-safe, so parallel splits use processes
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        results = pool.map(_split_one, files, outputs)
+    try:
+        for f, (outdir, error) in zip(files, results):
+            if error is None:
+                ok += 1
+                if not args.quiet:
+                    print(f"✔ Split: {os.path.basename(f)} -> {outdir}")
+            else:
+                fail += 1
+                print(f"✖ Error processing {f}: {error}", file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     if not args.quiet:
         print(f"Done. Success: {ok}, Failed: {fail}. Output root: {args.output}")
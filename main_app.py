@@ -1,15 +1,19 @@
+import importlib
+import itertools
 import os
 import threading
-import time
-from tkinter import filedialog, messagebox, simpledialog
+from tkinter import TclError, filedialog, messagebox, simpledialog, ttk
+from tkinter import font as tkfont
+from types import ModuleType
+from typing import Any
 
 import customtkinter as ctk
 from customtkinter import CTkImage
 from PIL import Image
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
-import bank_analyzer
-import bsa_settings
+# bank_analyzer (OCR/PDF stack) and bsa_settings are imported where they are
+# first used, so the window comes up without loading them.
 
 APP_NAME = "RSG Recovery Tools"
 
@@ -21,21 +25,186 @@ app.title(APP_NAME)
 app.geometry("1000x650")
 app.resizable(False, False)
 
+# --- Shared widget styling ---
+# One CTkFont per size, shared by every widget that uses it, instead of a new
+# font per widget from an ("Arial", n, "bold") tuple.
+PRIMARY_BTN = {"fg_color": "#0075c6", "hover_color": "#005a98", "text_color": "white"}
+AI_BTN = {"fg_color": "#ba0075", "hover_color": "#7e0059", "text_color": "white"}
+EXCL_BTN = {"fg_color": "#8e7cc3", "hover_color": "#0f6c2d", "text_color": "white"}
+FONT_BTN_SMALL = ctk.CTkFont(family="Arial", size=12, weight="bold")
+FONT_BTN = ctk.CTkFont(family="Arial", size=14, weight="bold")
+FONT_BTN_LARGE = ctk.CTkFont(family="Arial", size=16, weight="bold")
+FONT_BTN_TAB = ctk.CTkFont(family="Arial", size=13, weight="bold")
+FONT_FIELD = ctk.CTkFont(family="Arial", size=13)
+# Size/shape of the Import/Export buttons on the settings page
+SMALL_BTN = {"font": FONT_BTN_SMALL, "corner_radius": 14, "height": 30, "width": 110}
+# Plain Tk font for the canvas-drawn jumping letters (no CTk widget scaling)
+FONT_JUMP = tkfont.Font(family="Arial", size=26, weight="bold")
+
 # --- Modal Popup Tracker ---
 current_popup = {"window": None}
+# Main window position/size, kept current by <Configure>, so popups can be
+# centred without forcing an update_idletasks() flush on every open
+_app_geom: dict[str, int] = {}
+
+
+def _track_app_geometry(event):
+    # Bound on the root, so this also sees every child widget's Configure
+    if event.widget is app:
+        _app_geom.update(x=event.x, y=event.y, w=event.width, h=event.height)
+
+
+app.bind("<Configure>", _track_app_geometry, add="+")
+
+
+def center_popup(popup, popup_w, popup_h):
+    """Size popup and place it over the centre of the main window."""
+    if not _app_geom:
+        app.update_idletasks()
+        _app_geom.update(
+            x=app.winfo_x(), y=app.winfo_y(), w=app.winfo_width(), h=app.winfo_height()
+        )
+    center_x = _app_geom["x"] + (_app_geom["w"] // 2) - (popup_w // 2)
+    center_y = _app_geom["y"] + (_app_geom["h"] // 2) - (popup_h // 2)
+    popup.geometry(f"{popup_w}x{popup_h}+{center_x}+{center_y}")
+
+
+# --- Background runs: one per tool at a time ---
+_busy = {"bank": False, "ai": False, "evg": False}
+
+
+def start_worker(key, target, *args, on_done=None):
+    """Run target(*args) on a daemon thread; `key` stays busy until it returns.
+
+    on_done, if given, is called on the Tk thread once the worker has finished.
+    """
+    _busy[key] = True
+
+    def done():
+        _busy[key] = False
+        if on_done is not None:
+            on_done()
+
+    def run():
+        try:
+            target(*args)
+        finally:
+            # Hand completion back to the Tk thread rather than touching widgets here
+            app.after(0, done)
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def make_jump_animator(canvas, text, color, page):
+    """Return (start, stop) for the "jumping letters" busy animation on canvas.
+
+    Frames run on the Tk thread via after(); drawing pauses while the window is
+    minimized or `page` is not shown.
+    """
+    # The letter positions never change; only which letter is raised does
+    base_y = 25
+    jump_height = 12
+    char_widths = [15 if char != " " else 12 for char in text]
+    start_x = (int(canvas.cget("width")) - sum(char_widths)) // 2 + 5
+    letter_xs = list(itertools.accumulate(char_widths[:-1], initial=start_x))
+
+    letter_ids = []  # canvas items, created on the first frame of each run
+    anim_job = [None]  # pending after() id of the animation
+
+    def draw(idx):
+        # Move the previously raised letter back down and raise the next one
+        if not letter_ids:
+            letter_ids.extend(
+                canvas.create_text(x, base_y, text=char, fill=color, font=FONT_JUMP)
+                for x, char in zip(letter_xs, text)
+            )
+        prev = (idx - 1) % len(letter_ids)
+        canvas.coords(letter_ids[prev], letter_xs[prev], base_y)
+        canvas.coords(letter_ids[idx], letter_xs[idx], base_y - jump_height)
+
+    def animate(idx=0):
+        try:
+            if app.state() == "iconic" or not page.winfo_ismapped():
+                # Nothing to see while minimized or on a hidden page; check back later
+                anim_job[0] = canvas.after(300, animate, idx)
+                return
+            draw(idx)
+            anim_job[0] = canvas.after(130, animate, (idx + 1) % len(text))
+        except TclError:
+            # The canvas was destroyed with its page (e.g. replaced by results)
+            anim_job[0] = None
+
+    def stop():
+        if not canvas.winfo_exists():
+            return
+        if anim_job[0] is not None:
+            canvas.after_cancel(anim_job[0])
+            anim_job[0] = None
+        canvas.delete("all")
+        letter_ids.clear()
+        canvas.pack_forget()
+
+    def start():
+        stop()  # keep a single after() chain
+        canvas.pack(pady=(8, 12))
+        animate()
+
+    return start, stop
+
+
+ENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+# Parsed .env lines and values, reused until the file's mtime changes
+_ENV_CACHE: dict[str, Any] = {"mtime": None, "lines": [], "values": {}}
+
+
+def _load_env_file():
+    try:
+        mtime = os.stat(ENV_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _ENV_CACHE["mtime"]:
+        lines, values = [], {}
+        if mtime is not None:
+            with open(ENV_PATH, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        for line in lines:
+            key, sep, val = line.strip().partition("=")
+            if sep:
+                values[key.strip()] = val.strip().strip("\"'")
+        _ENV_CACHE.update(mtime=mtime, lines=lines, values=values)
+    return _ENV_CACHE
+
+
+_DOTENV_LOADED = False
+
+
+def load_dotenv_once():
+    """Load a local .env into os.environ on first use (optional, for dev runs)."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+    try:
+        from dotenv import load_dotenv  # safe even if not installed in prod/CI
+
+        load_dotenv()
+    except Exception:
+        pass
+
+
+def get_env_key(name: str, default: str = "") -> str:
+    """Return NAME from the project .env file (cached), or default."""
+    return _load_env_file()["values"].get(name, default)
 
 
 def write_env_key(name: str, value: str):
     """Upsert NAME=value into a .env file in the project directory (same dir as this script)."""
-    root_dir = os.path.dirname(os.path.abspath(__file__))
-    env_path = os.path.join(root_dir, ".env")
-    lines = []
-    if os.path.exists(env_path):
-        with open(env_path, "r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
+    cache = _load_env_file()
+    if cache["values"].get(name) == value:
+        return
     written = False
     new_lines = []
-    for line in lines:
+    for line in cache["lines"]:
         if line.strip().startswith(f"{name}="):
             new_lines.append(f'{name}="{value}"')
             written = True
@@ -43,8 +212,13 @@ def write_env_key(name: str, value: str):
             new_lines.append(line)
     if not written:
         new_lines.append(f'{name}="{value}"')
-    with open(env_path, "w", encoding="utf-8") as f:
+    tmp_path = ENV_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         f.write("\n".join(new_lines) + "\n")
+    os.replace(tmp_path, ENV_PATH)
+    cache["values"][name] = value
+    cache.update(mtime=os.stat(ENV_PATH).st_mtime_ns, lines=new_lines)
+
 
 # --- Sidebar (Left) ---
 # Widen sidebar so longer button labels fit
@@ -57,42 +231,103 @@ content.pack(side="left", fill="both", expand=True)
 
 
 def resize_keep_aspect(img, max_size):
-    w, h = img.size
-    if w > h:
-        new_w = max_size
-        new_h = int(h * max_size / w)
-    else:
-        new_h = max_size
-        new_w = int(w * max_size / h)
-    return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    # Shrinks in place (never enlarges); bilinear is plenty for a small logo
+    img.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+    return img
+
+
+# Resized logo CTkImages by target size
+_LOGO_CACHE: dict[int, CTkImage | None] = {}
+
+
+def get_logo(max_size=260):
+    """Return the logo as a CTkImage no larger than max_size, or None if unavailable."""
+    if max_size not in _LOGO_CACHE:
+        try:
+            with Image.open("logo.png") as img:
+                img = resize_keep_aspect(img, max_size)
+            _LOGO_CACHE[max_size] = CTkImage(light_image=img, size=img.size)
+        except Exception:
+            _LOGO_CACHE[max_size] = None
+    return _LOGO_CACHE[max_size]
+
+
+_OPTIONAL_MODULES: dict[str, ModuleType | None] = {}
+
+
+def optional_import(name):
+    """Import an optional module on first use; None if unavailable (also remembered)."""
+    if name not in _OPTIONAL_MODULES:
+        try:
+            _OPTIONAL_MODULES[name] = importlib.import_module(name)
+        except Exception:
+            _OPTIONAL_MODULES[name] = None
+    return _OPTIONAL_MODULES[name]
+
+
+def is_pdf(path):
+    """True if path has a .pdf extension (any case); only the extension is lowered."""
+    return os.path.splitext(path)[1].lower() == ".pdf"
+
+
+# Merchant columns in bsa_settings order (notes is edited separately), with the
+# Add popup's label for each
+MERCHANT_FIELD_LABELS = {
+    "root": "Root",
+    "name": "MP Name",
+    "co": "C/O",
+    "address": "Address",
+    "city": "City",
+    "state": "State",
+    "zip": "ZIP",
+}
+
+EVG_OUTPUT_ROOT = os.path.join(
+    os.path.expanduser("~"), "Desktop", "RSG Recovery Tools data output"
+)
+
+SIDEBAR_LABELS = {"admin": "Admin", "collections": "Collections", "sales": "Sales"}
+
+# Built sidebar/content pages, kept and re-packed instead of rebuilt on navigation
+_sidebar_pages: dict[str, ctk.CTkFrame] = {}
+# Keyed by page name, or (name, list mode) for the BSA settings tabs
+_content_pages: dict[str | tuple[str, str], ctk.CTkFrame] = {}
+_shown: dict[str, str | tuple[str, str] | None] = {"sidebar": None, "content": None}
 
 
 def set_sidebar(mode):
-    for widget in sidebar.winfo_children():
-        widget.destroy()
+    current = _sidebar_pages.get(_shown["sidebar"])
+    if current is not None and _shown["sidebar"] != mode:
+        current.pack_forget()
+    _shown["sidebar"] = mode
     if mode == "main_menu":
         return
+    page = _sidebar_pages.get(mode)
+    if page is None:
+        page = _sidebar_pages[mode] = ctk.CTkFrame(
+            sidebar, fg_color="#f2f6fa", corner_radius=0
+        )
+        build_sidebar(mode, page)
+    page.pack(fill="both", expand=True)
+
+
+def build_sidebar(mode, sidebar):
     # --- Admin sidebar buttons ---
     main_menu_btn = ctk.CTkButton(
         sidebar,
         text="Main Menu",
         command=show_main_menu,
-        fg_color="#0075c6",
-        hover_color="#005a98",
-        text_color="white",
-        font=("Arial", 12, "bold"),
+        **PRIMARY_BTN,
+        font=FONT_BTN_SMALL,
         corner_radius=20,
         height=32,
         width=120,
     )
     main_menu_btn.pack(pady=(25, 12), padx=18, anchor="nw")
 
-    label = {"admin": "Admin", "collections": "Collections", "sales": "Sales"}.get(
-        mode, ""
-    )
     ctk.CTkLabel(
         sidebar,
-        text=label,
+        text=SIDEBAR_LABELS.get(mode, ""),
         font=("Arial", 18, "bold"),
         text_color="#0075c6",
         fg_color="#f2f6fa",
@@ -110,10 +345,8 @@ def set_sidebar(mode):
                 sidebar,
                 text=text,
                 command=cmd,
-                fg_color="#0075c6",
-                hover_color="#005a98",
-                text_color="white",
-                font=("Arial", 14, "bold"),
+                **PRIMARY_BTN,
+                font=FONT_BTN,
                 corner_radius=20,
                 height=38,
                 width=260,
@@ -121,23 +354,42 @@ def set_sidebar(mode):
 
 
 def set_content(mode):
-    for widget in content.winfo_children():
-        widget.destroy()
-
     # Track which BSA Settings tab is selected ("mp" or "excl")
     if not hasattr(set_content, "bsa_settings_list_mode"):
         set_content.bsa_settings_list_mode = "mp"
+    key = mode
+    if mode == "bsa_settings":
+        key = (mode, set_content.bsa_settings_list_mode)
+
+    current = _content_pages.get(_shown["content"])
+    if current is not None and _shown["content"] != key:
+        current.pack_forget()
+    _shown["content"] = key
+
+    page = _content_pages.get(key)
+    if page is not None and getattr(page, "is_stale", lambda: False)():
+        page.destroy()
+        page = None
+    if page is None:
+        page = _content_pages[key] = ctk.CTkFrame(
+            content, fg_color="white", corner_radius=0
+        )
+        build_content(mode, page)
+    elif hasattr(page, "on_show"):
+        page.on_show()
+    page.pack(fill="both", expand=True)
+
+
+def build_content(mode, content):
     list_mode = set_content.bsa_settings_list_mode
 
     if mode == "main_menu":
-        try:
-            logo_image = Image.open("logo.png")
-            logo_image = resize_keep_aspect(logo_image, 260)
-            logo = CTkImage(light_image=logo_image, size=logo_image.size)
+        logo = get_logo()
+        if logo is not None:
             ctk.CTkLabel(
                 content, image=logo, text="", fg_color="white", bg_color="white"
             ).pack(pady=(50, 30))
-        except Exception:
+        else:
             ctk.CTkLabel(
                 content,
                 text="LOGO",
@@ -165,10 +417,8 @@ def set_content(mode):
                 content,
                 text=text,
                 command=cmd,
-                fg_color="#0075c6",
-                hover_color="#005a98",
-                text_color="white",
-                font=("Arial", 16, "bold"),
+                **PRIMARY_BTN,
+                font=FONT_BTN_LARGE,
                 corner_radius=30,
                 height=44,
                 width=320,
@@ -228,85 +478,49 @@ def set_content(mode):
         )
         selected_label.pack(pady=5)
 
-        thinking_event = threading.Event()
-
-        def draw_jumping_letters(idx=0):
-            if not jumping_canvas.winfo_exists():
-                return
-            jumping_canvas.delete("all")
-            base_y = 25
-            jump_height = 12
-            font_size = 26
-            font = ("Arial", font_size, "bold")
-            spacing = 0
-            char_widths = []
-            for char in jumping_text:
-                char_widths.append(15 if char != " " else 12)
-            total_width = sum(char_widths) + spacing * (len(jumping_text) - 1)
-            start_x = (canvas_width - total_width) // 2 + 5
-            x = start_x
-            for i, char in enumerate(jumping_text):
-                y = base_y - jump_height if i == idx else base_y
-                jumping_canvas.create_text(x, y, text=char, fill="#0075c6", font=font)
-                x += char_widths[i] + spacing
-
-        def animate_jumping_letters():
-            idx = 0
-            if not jumping_canvas.winfo_exists():
-                return
-            jumping_canvas.pack(pady=(8, 12))
-            try:
-                while not thinking_event.is_set():
-                    if not jumping_canvas.winfo_exists():
-                        return
-                    draw_jumping_letters(idx)
-                    idx = (idx + 1) % len(jumping_text)
-                    time.sleep(0.13)
-            finally:
-                if jumping_canvas.winfo_exists():
-                    jumping_canvas.delete("all")
-                    jumping_canvas.pack_forget()
+        start_jumping_letters, stop_jumping_letters = make_jump_animator(
+            jumping_canvas, jumping_text, "#0075c6", content
+        )
 
         # --- END JUMPING LETTERS ANIMATION ---
 
         def run_bank_analyzer(filepaths):
-            try:
-                bank_analyzer.process_bank_statements_full(filepaths, content)
-            finally:
-                thinking_event.set()
+            import bank_analyzer
+
+            bank_analyzer.process_bank_statements_full(filepaths, content)
 
         def on_drop(event):
+            if _busy["bank"]:
+                return
             filepaths = app.tk.splitlist(event.data)
-            selected_label.configure(text="")
-            thinking_event.clear()
-            threading.Thread(target=animate_jumping_letters, daemon=True).start()
-            threading.Thread(
-                target=run_bank_analyzer, args=(filepaths,), daemon=True
-            ).start()
+            selected_label.configure(text=f"{len(filepaths)} file(s) selected")
+            start_jumping_letters()
+            start_worker(
+                "bank", run_bank_analyzer, filepaths, on_done=stop_jumping_letters
+            )
 
         drop_frame.drop_target_register(DND_FILES)
         drop_frame.dnd_bind("<<Drop>>", on_drop)
 
         def browse_files():
+            if _busy["bank"]:
+                return
             filepaths = filedialog.askopenfilenames(
                 title="Select Bank Statement PDFs", filetypes=[("PDF files", "*.pdf")]
             )
             if filepaths:
-                selected_label.configure(text="")
-                thinking_event.clear()
-                threading.Thread(target=animate_jumping_letters, daemon=True).start()
-                threading.Thread(
-                    target=run_bank_analyzer, args=(filepaths,), daemon=True
-                ).start()
+                selected_label.configure(text=f"{len(filepaths)} file(s) selected")
+                start_jumping_letters()
+                start_worker(
+                    "bank", run_bank_analyzer, filepaths, on_done=stop_jumping_letters
+                )
 
         ctk.CTkButton(
             content,
             text="Browse Files",
             command=browse_files,
-            fg_color="#0075c6",
-            hover_color="#005a98",
-            text_color="white",
-            font=("Arial", 14, "bold"),
+            **PRIMARY_BTN,
+            font=FONT_BTN,
             corner_radius=22,
             width=180,
         ).pack(pady=18)
@@ -355,60 +569,15 @@ def set_content(mode):
         )
         selected_label.pack(pady=5)
 
-        thinking_event = threading.Event()
-
-        def draw_jumping_letters(idx=0):
-            if not jumping_canvas.winfo_exists():
-                return
-            jumping_canvas.delete("all")
-            base_y = 25
-            jump_height = 12
-            font_size = 26
-            font = ("Arial", font_size, "bold")
-            spacing = 0
-            char_widths = []
-            for char in jumping_text:
-                char_widths.append(15 if char != " " else 12)
-            total_width = sum(char_widths) + spacing * (len(jumping_text) - 1)
-            start_x = (canvas_width - total_width) // 2 + 5
-            x = start_x
-            for i, char in enumerate(jumping_text):
-                y = base_y - jump_height if i == idx else base_y
-                jumping_canvas.create_text(x, y, text=char, fill="#ba0075", font=font)
-                x += char_widths[i] + spacing
-
-        def animate_jumping_letters():
-            idx = 0
-            if not jumping_canvas.winfo_exists():
-                return
-            jumping_canvas.pack(pady=(8, 12))
-            try:
-                while not thinking_event.is_set():
-                    if not jumping_canvas.winfo_exists():
-                        return
-                    draw_jumping_letters(idx)
-                    idx = (idx + 1) % len(jumping_text)
-                    time.sleep(0.13)
-            finally:
-                if jumping_canvas.winfo_exists():
-                    jumping_canvas.delete("all")
-                    jumping_canvas.pack_forget()
+        start_jumping_letters, stop_jumping_letters = make_jump_animator(
+            jumping_canvas, jumping_text, "#ba0075", content
+        )
 
         # --- END JUMPING LETTERS ANIMATION ---
 
         def run_ai_analyzer(filepaths):
-            import os
-            from tkinter import messagebox
-
-            # Optional: allow local .env files in dev without changing CI
-            try:
-                from dotenv import load_dotenv  # safe even if not installed in prod/CI
-
-                load_dotenv()
-            except Exception:
-                pass
-
-            openai_api_key = os.getenv("OPENAI_API_KEY", "")
+            load_dotenv_once()
+            openai_api_key = os.getenv("OPENAI_API_KEY", "") or get_env_key("OPENAI_API_KEY")
             if not openai_api_key:
                 try:
                     import config  # optional, ignored by git
@@ -430,12 +599,10 @@ def set_content(mode):
                         os.environ["OPENAI_API_KEY"] = key
                         openai_api_key = key
                     except Exception as e:
-                        thinking_event.set()
                         messagebox.showerror("Save Error", str(e))
                         return
                 else:
-                    # Stop the animation and inform the user clearly
-                    thinking_event.set()
+                    # Inform the user clearly; the animation stops when this returns
                     messagebox.showerror(
                         "Missing API Key",
                         "OPENAI_API_KEY is not set.\n\n"
@@ -453,41 +620,41 @@ def set_content(mode):
                 )
             except Exception as e:
                 messagebox.showerror("AI Analysis Error", f"{e}")
-            finally:
-                thinking_event.set()
 
         def on_drop(event):
+            if _busy["ai"]:
+                return
             filepaths = app.tk.splitlist(event.data)
             selected_label.configure(text="")
-            thinking_event.clear()
-            threading.Thread(target=animate_jumping_letters, daemon=True).start()
-            threading.Thread(
-                target=run_ai_analyzer, args=(filepaths,), daemon=True
-            ).start()
+            start_jumping_letters()
+            start_worker(
+                "ai", run_ai_analyzer, filepaths, on_done=stop_jumping_letters
+            )
 
         drop_frame.drop_target_register(DND_FILES)
         drop_frame.dnd_bind("<<Drop>>", on_drop)
+        # ai_analysis replaces this page's widgets with its results; rebuild on next visit
+        content.is_stale = lambda: not drop_frame.winfo_exists()
 
         def browse_files():
+            if _busy["ai"]:
+                return
             filepaths = filedialog.askopenfilenames(
                 title="Select Bank Statement PDFs", filetypes=[("PDF files", "*.pdf")]
             )
             if filepaths:
                 selected_label.configure(text="")
-                thinking_event.clear()
-                threading.Thread(target=animate_jumping_letters, daemon=True).start()
-                threading.Thread(
-                    target=run_ai_analyzer, args=(filepaths,), daemon=True
-                ).start()
+                start_jumping_letters()
+                start_worker(
+                    "ai", run_ai_analyzer, filepaths, on_done=stop_jumping_letters
+                )
 
         ctk.CTkButton(
             content,
             text="Browse Files",
             command=browse_files,
-            fg_color="#ba0075",
-            hover_color="#7e0059",
-            text_color="white",
-            font=("Arial", 14, "bold"),
+            **AI_BTN,
+            font=FONT_BTN,
             corner_radius=22,
             width=180,
         ).pack(pady=18)
@@ -512,15 +679,15 @@ def set_content(mode):
             content,
             text="Set/OpenAI Key",
             command=set_openai_key,
-            fg_color="#ba0075",
-            hover_color="#7e0059",
-            text_color="white",
-            font=("Arial", 13, "bold"),
+            **AI_BTN,
+            font=FONT_BTN_TAB,
             corner_radius=22,
             width=180,
         ).pack(pady=(0, 18))
 
     elif mode == "bsa_settings":
+        import bsa_settings
+
         ctk.CTkLabel(
             content,
             text="Bank Statement Analyzer Settings",
@@ -540,7 +707,7 @@ def set_content(mode):
             ),
             fg_color="#0075c6" if list_mode == "mp" else "#eee",
             text_color="white" if list_mode == "mp" else "#0075c6",
-            font=("Arial", 13, "bold"),
+            font=FONT_BTN_TAB,
             corner_radius=13,
             width=200,
         )
@@ -553,7 +720,7 @@ def set_content(mode):
             ),
             fg_color="#8e7cc3" if list_mode == "excl" else "#eee",
             text_color="white" if list_mode == "excl" else "#8e7cc3",
-            font=("Arial", 13, "bold"),
+            font=FONT_BTN_TAB,
             corner_radius=13,
             width=200,
         )
@@ -587,35 +754,21 @@ def set_content(mode):
                     messagebox.showinfo(
                         "Imported!", f"Merchant list imported from:\n{path}"
                     )
-                    merchants_now = bsa_settings.get_all_merchants_with_ids()
-                    print(
-                        f"[DEBUG] After import: {len(merchants_now)} merchant(s) in DB: {merchants_now}"
-                    )
-                    refresh_table()
+                    refresh_table(dirty=True)
 
             ctk.CTkButton(
                 btn_frame,
                 text="Import",
                 command=do_import,
-                fg_color="#0075c6",
-                hover_color="#005a98",
-                text_color="white",
-                font=("Arial", 12, "bold"),
-                corner_radius=14,
-                height=30,
-                width=110,
+                **PRIMARY_BTN,
+                **SMALL_BTN,
             ).pack(side="left", padx=4)
             ctk.CTkButton(
                 btn_frame,
                 text="Export",
                 command=do_export,
-                fg_color="#0075c6",
-                hover_color="#005a98",
-                text_color="white",
-                font=("Arial", 12, "bold"),
-                corner_radius=14,
-                height=30,
-                width=110,
+                **PRIMARY_BTN,
+                **SMALL_BTN,
             ).pack(side="left", padx=4)
         else:
 
@@ -640,192 +793,177 @@ def set_content(mode):
                     messagebox.showinfo(
                         "Imported!", f"Exclusion list imported from:\n{path}"
                     )
-                    exclusions_now = bsa_settings.get_all_exclusions_with_ids()
-                    print(
-                        f"[DEBUG] After import: {len(exclusions_now)} exclusions in DB: {exclusions_now}"
-                    )
-                    refresh_table()
+                    refresh_table(dirty=True)
 
             ctk.CTkButton(
                 btn_frame,
                 text="Import",
                 command=do_import,
-                fg_color="#8e7cc3",
-                hover_color="#0f6c2d",
-                text_color="white",
-                font=("Arial", 12, "bold"),
-                corner_radius=14,
-                height=30,
-                width=110,
+                **EXCL_BTN,
+                **SMALL_BTN,
             ).pack(side="left", padx=4)
             ctk.CTkButton(
                 btn_frame,
                 text="Export",
                 command=do_export,
-                fg_color="#8e7cc3",
-                hover_color="#0f6c2d",
-                text_color="white",
-                font=("Arial", 12, "bold"),
-                corner_radius=14,
-                height=30,
-                width=110,
+                **EXCL_BTN,
+                **SMALL_BTN,
             ).pack(side="left", padx=4)
 
         # --- Scrollable Table ---
+        accent = "#0075c6" if list_mode == "mp" else "#8e7cc3"
+        style = ttk.Style(app)
+        style.configure(
+            "BSA.Treeview", font=("Arial", 12), rowheight=28, background="white"
+        )
+        style.configure(
+            "BSA.Treeview.Heading", font=("Arial", 13, "bold"), foreground=accent
+        )
+        style.map(
+            "BSA.Treeview",
+            background=[("selected", "#e5f2ff")],
+            foreground=[("selected", "black")],
+        )
+
+        if list_mode == "mp":
+            columns = ["root", "name", "co", "address", "city", "state", "zip", "notes"]
+            headers = [
+                "Root",
+                "Merchant Processor",
+                "C/O",
+                "Address",
+                "City",
+                "State",
+                "ZIP",
+                "Notes",
+            ]
+            widths = [80, 200, 80, 170, 90, 50, 60, 180]
+        else:
+            columns = ["entity", "reason", "notes"]
+            headers = ["Excluded Entity", "Reason", "Notes"]
+            widths = [220, 180, 210]
+
         table_frame = ctk.CTkFrame(content, fg_color="white", corner_radius=12)
         table_frame.pack(fill="both", expand=True, pady=(10, 0), padx=16)
-        canvas = ctk.CTkCanvas(table_frame, bg="white", highlightthickness=0)
-        canvas.pack(side="left", fill="both", expand=True)
-        vsb = ctk.CTkScrollbar(
-            table_frame, orientation="vertical", command=canvas.yview
+        tree = ttk.Treeview(
+            table_frame,
+            columns=columns,
+            show="headings",
+            selectmode="extended",
+            style="BSA.Treeview",
         )
+        for col, h, w in zip(columns, headers, widths, strict=False):
+            tree.heading(col, text=h, anchor="w")
+            tree.column(col, width=w, minwidth=40, anchor="w", stretch=False)
+        tree.pack(side="left", fill="both", expand=True)
+        vsb = ctk.CTkScrollbar(table_frame, orientation="vertical", command=tree.yview)
         vsb.pack(side="right", fill="y")
-        canvas.configure(yscrollcommand=vsb.set)
-        table_inner = ctk.CTkFrame(canvas, fg_color="white")
-        canvas.create_window((0, 0), window=table_inner, anchor="nw")
+        tree.configure(yscrollcommand=vsb.set)
 
-        set_content.checkbox_vars = {}
+        if list_mode == "mp":
 
-        def on_frame_configure(evt):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            def on_tree_double_click(event):
+                row_id = tree.identify_row(event.y)
+                if row_id:
+                    open_edit_popup(int(row_id))
 
-        table_inner.bind("<Configure>", on_frame_configure)
+            tree.bind("<Double-1>", on_tree_double_click)
 
         # --- Table/CRUD context setup ---
-        def refresh_table():
-            for w in table_inner.winfo_children():
-                w.destroy()
-            set_content.checkbox_vars.clear()
-            if list_mode == "mp":
-                items = bsa_settings.get_all_merchants_with_ids()
-                headers = [
-                    "",
-                    "Root",
-                    "Merchant Processor",
-                    "C/O",
-                    "Address",
-                    "City",
-                    "State",
-                    "ZIP",
-                    "Notes",
-                ]
-                widths = [3, 80, 200, 80, 170, 90, 50, 60, 180]
-            else:
-                items = bsa_settings.get_all_exclusions_with_ids()
-                headers = ["", "Excluded Entity", "Reason", "Notes"]
-                widths = [3, 220, 180, 210]
-
-            for col, (h, w) in enumerate(zip(headers, widths, strict=False)):
-                ctk.CTkLabel(
-                    table_inner,
-                    text=h,
-                    font=("Arial", 13, "bold"),
-                    text_color="#0075c6" if list_mode == "mp" else "#8e7cc3",
-                    anchor="w",
-                    width=w,
-                ).grid(row=0, column=col, sticky="w", padx=(4 if col == 0 else 2, 2))
-
-            for r, row in enumerate(items, start=1):
-                var = ctk.BooleanVar()
-                set_content.checkbox_vars[row[0]] = var
-                ctk.CTkCheckBox(
-                    table_inner,
-                    variable=var,
-                    text="",
-                    width=18,
-                    fg_color="#0075c6" if list_mode == "mp" else "#8e7cc3",
-                ).grid(row=r, column=0, padx=(4, 2), pady=2, sticky="w")
-                for ci, val in enumerate(row[1:], start=1):
-                    lbl = ctk.CTkLabel(
-                        table_inner,
-                        text=val or "",
-                        anchor="w",
-                        width=widths[ci],
-                        font=("Arial", 12),
-                    )
-
-                    # If this is the Merchant Name column, make it clickable and highlight on hover
-                    if list_mode == "mp" and ci == 1:  # Only for Merchant Name
-
-                        def make_edit_handler(
-                            row_id=row[0],
-                        ):  # Need default arg to avoid late binding
-                            def handler(event=None):
-                                open_edit_popup(row_id)
-
-                            return handler
-
-                        def on_enter(e, label=lbl):
-                            label.configure(bg_color="#e5f2ff")
+        rendered = {}  # iid -> values currently shown in the tree
+        # Last rows read from the DB; re-queried only after an edit on this page
+        # (dirty) or when the DB file changed underneath us (e.g. approved suggestions)
+        table_cache = {"items": None, "dirty": True, "mtime": None}
 
-                        def on_leave(e, label=lbl):
-                            label.configure(bg_color="white")
+        def db_mtime():
+            try:
+                return os.path.getmtime(bsa_settings.DB_NAME)
+            except OSError:
+                return None
 
-                        lbl.bind("<Button-1>", make_edit_handler())
-                        lbl.bind("<Enter>", on_enter)
-                        lbl.bind("<Leave>", on_leave)
-                        lbl.configure(cursor="hand2")
-                    lbl.grid(row=r, column=ci, sticky="w", padx=2, pady=2)
+        def load_items():
+            mtime = db_mtime()
+            if table_cache["dirty"] or mtime != table_cache["mtime"]:
+                if list_mode == "mp":
+                    table_cache["items"] = bsa_settings.get_all_merchants_with_ids()
+                else:
+                    table_cache["items"] = bsa_settings.get_all_exclusions_with_ids()
+                table_cache["dirty"] = False
+                table_cache["mtime"] = mtime
+            return table_cache["items"]
+
+        def refresh_table(dirty=False):
+            # Update the tree in place: only new, changed or removed rows touch Tk
+            if dirty:
+                table_cache["dirty"] = True
+            items = load_items()
+            seen = set()
+            for index, row in enumerate(items):
+                iid = str(row[0])
+                values = tuple(v or "" for v in row[1:])
+                seen.add(iid)
+                if iid not in rendered:
+                    tree.insert("", index, iid=iid, values=values)
+                else:
+                    if rendered[iid] != values:
+                        tree.item(iid, values=values)
+                    if tree.index(iid) != index:
+                        tree.move(iid, "", index)
+                rendered[iid] = values
+            stale = [iid for iid in rendered if iid not in seen]
+            if stale:
+                tree.delete(*stale)
+                for iid in stale:
+                    del rendered[iid]
 
         refresh_table()
+        # The page is kept between visits; pick up changes made since
+        content.on_show = refresh_table
 
-        def open_edit_popup(row_id):
-            data = bsa_settings.get_merchant_by_id(row_id)
-            if not data:
-                messagebox.showerror("Error", "Merchant not found!")
-                return
+        edit_popup = {}  # built once, then hidden/shown: window, vars, notes_box, row_id
+        edit_fields = list(MERCHANT_FIELD_LABELS)
+
+        def build_edit_popup():
             popup = ctk.CTkToplevel(app)
+            popup.withdraw()
             popup.transient(app)
-            popup.grab_set()
-            popup.lift()
-            popup.focus_force()
-
-            popup_w, popup_h = 420, 545
-
-            app.update_idletasks()
-            parent_x = app.winfo_x()
-            parent_y = app.winfo_y()
-            parent_w = app.winfo_width()
-            parent_h = app.winfo_height()
-
-            center_x = parent_x + (parent_w // 2) - (popup_w // 2)
-            center_y = parent_y + (parent_h // 2) - (popup_h // 2)
-            popup.geometry(f"{popup_w}x{popup_h}+{center_x}+{center_y}")
-            popup.title(f"Edit Merchant: {data['name']}")
 
-            fields = ["root", "name", "co", "address", "city", "state", "zip", "notes"]
-            vars = {f: ctk.StringVar(value=data.get(f, "")) for f in fields}
+            vars = {f: ctk.StringVar() for f in edit_fields}
             row = 0
 
             popup.grid_columnconfigure(1, weight=1)
 
-            for f in fields[:-1]:
-                display_name = f.capitalize() if f != "co" else "C/O"
-                ctk.CTkLabel(popup, text=display_name + ":", font=("Arial", 13)).grid(
+            for f in edit_fields:
+                ctk.CTkLabel(popup, text=MERCHANT_FIELD_LABELS[f] + ":", font=FONT_FIELD).grid(
                     row=row, column=0, sticky="e", padx=14, pady=6
                 )
-                ctk.CTkEntry(popup, textvariable=vars[f], width=280).grid(
+                ctk.CTkEntry(popup, textvariable=vars[f], width=280, font=FONT_FIELD).grid(
                     row=row, column=1, padx=8, pady=6, sticky="ew"
                 )
                 row += 1
 
-            ctk.CTkLabel(popup, text="Notes:", font=("Arial", 13)).grid(
+            ctk.CTkLabel(popup, text="Notes:", font=FONT_FIELD).grid(
                 row=row, column=0, sticky="ne", padx=14, pady=6
             )
-            notes_box = ctk.CTkTextbox(popup, width=280, height=64)
-            notes_box.insert("1.0", data["notes"] or "")
+            notes_box = ctk.CTkTextbox(popup, width=280, height=64, font=FONT_FIELD)
             notes_box.grid(row=row, column=1, padx=8, pady=6, sticky="nsew")
 
             # Let notes box expand if window resizes
             popup.grid_rowconfigure(row, weight=1)
             row += 1
 
+            def close_popup():
+                popup.grab_release()
+                popup.withdraw()
+
             def save_changes():
                 bsa_settings.edit_merchant_by_id(
-                    row_id, data.get("root", ""), *[vars[f].get() for f in fields]
+                    edit_popup["row_id"],
+                    *[vars[f].get() for f in edit_fields],
+                    notes_box.get("1.0", "end-1c"),
                 )
-                popup.destroy()
-                refresh_table()
+                close_popup()
+                refresh_table(dirty=True)
 
             btnf = ctk.CTkFrame(popup, fg_color="white", corner_radius=0)
             btnf.grid(row=row, column=0, columnspan=2, pady=(0, 20))
@@ -833,10 +971,37 @@ def set_content(mode):
                 btnf, text="Save", command=save_changes, fg_color="#0075c6", width=90
             ).pack(side="left", padx=8)
             ctk.CTkButton(
-                btnf, text="Cancel", command=popup.destroy, fg_color="#bbb", width=90
+                btnf, text="Cancel", command=close_popup, fg_color="#bbb", width=90
             ).pack(side="left", padx=8)
+            popup.protocol("WM_DELETE_WINDOW", close_popup)
+
+            edit_popup.update(window=popup, vars=vars, notes_box=notes_box)
+
+        def open_edit_popup(row_id):
+            data = bsa_settings.get_merchant_by_id(row_id)
+            if not data:
+                messagebox.showerror("Error", "Merchant not found!")
+                return
+            if not edit_popup or not edit_popup["window"].winfo_exists():
+                build_edit_popup()
+            popup = edit_popup["window"]
+            edit_popup["row_id"] = row_id
+            for f, var in edit_popup["vars"].items():
+                var.set(data.get(f) or "")
+            notes_box = edit_popup["notes_box"]
+            notes_box.delete("1.0", "end")
+            notes_box.insert("1.0", data["notes"] or "")
+
+            center_popup(popup, 420, 545)
+            popup.title(f"Edit Merchant: {data['name']}")
+            popup.deiconify()
+            popup.lift()
+            popup.focus_force()
+            popup.grab_set()
 
         # --- Add/Edit Popups (unchanged, but call correct CRUD for each tab) ---
+        add_vars = {}  # Add Merchant StringVars, created on first open and kept
+
         def add_item_popup():
             if current_popup["window"] and current_popup["window"].winfo_exists():
                 current_popup["window"].lift()
@@ -844,53 +1009,50 @@ def set_content(mode):
                 return
             popup = ctk.CTkToplevel(app)
             popup.transient(app)
-            popup.grab_set()
-            popup.lift()
-            popup.focus_force()
-
-            popup_w, popup_h = 420, 545
-
-            app.update_idletasks()
-            parent_x = app.winfo_x()
-            parent_y = app.winfo_y()
-            parent_w = app.winfo_width()
-            parent_h = app.winfo_height()
 
-            center_x = parent_x + (parent_w // 2) - (popup_w // 2)
-            center_y = parent_y + (parent_h // 2) - (popup_h // 2)
-            popup.geometry(f"{popup_w}x{popup_h}+{center_x}+{center_y}")
+            center_popup(popup, 420, 545)
             current_popup["window"] = popup
 
             popup.grid_columnconfigure(1, weight=1)
 
             if set_content.bsa_settings_list_mode == "mp":
                 popup.title("Add Merchant Processor")
-                labels = ["Root", "MP Name", "C/O", "Address", "City", "State", "ZIP"]
-                vars = [ctk.StringVar() for _ in labels]
+                labels = MERCHANT_FIELD_LABELS
+                # Reuse the Tcl variables from earlier opens; just clear them
+                if not add_vars:
+                    add_vars.update((field, ctk.StringVar()) for field in labels)
+                for var in add_vars.values():
+                    var.set("")
+                vars = add_vars
 
                 # --- Layout fields ---
-                for i, (lbl, var) in enumerate(zip(labels, vars, strict=False)):
-                    pretty_lbl = lbl if lbl != "C/O" else "C/O"
-                    ctk.CTkLabel(popup, text=pretty_lbl + ":", font=("Arial", 13)).grid(
+                for i, (field, lbl) in enumerate(labels.items()):
+                    ctk.CTkLabel(popup, text=lbl + ":", font=FONT_FIELD).grid(
                         row=i, column=0, sticky="e", padx=14, pady=6
                     )
-                    ctk.CTkEntry(popup, textvariable=var, width=280).grid(
+                    ctk.CTkEntry(popup, textvariable=vars[field], width=280, font=FONT_FIELD).grid(
                         row=i, column=1, padx=8, pady=6, sticky="ew"
                     )
 
                 # Notes (multiline) field
                 notes_row = len(labels)
-                ctk.CTkLabel(popup, text="Notes:", font=("Arial", 13)).grid(
+                ctk.CTkLabel(popup, text="Notes:", font=FONT_FIELD).grid(
                     row=notes_row, column=0, sticky="ne", padx=14, pady=6
                 )
-                notes_box = ctk.CTkTextbox(popup, width=280, height=64)
+                notes_box = ctk.CTkTextbox(popup, width=280, height=64, font=FONT_FIELD)
                 notes_box.grid(row=notes_row, column=1, padx=8, pady=6, sticky="nsew")
 
                 # Let notes box expand
                 popup.grid_rowconfigure(notes_row, weight=1)
 
+                # Validation message, gridded only when there is something to show
+                error_row = notes_row + 1
+                error_label = ctk.CTkLabel(
+                    popup, text="", font=FONT_FIELD, text_color="#c0392b"
+                )
+
                 # Save/Cancel buttons
-                btn_row = notes_row + 1
+                btn_row = error_row + 1
                 btnf = ctk.CTkFrame(popup, fg_color="white", corner_radius=0)
                 btnf.grid(row=btn_row, column=0, columnspan=2, pady=(0, 20))
                 ctk.CTkButton(
@@ -909,17 +1071,25 @@ def set_content(mode):
                 ).pack(side="left", padx=8)
 
                 def add_and_close():
-                    data = [v.get().strip() for v in vars]
-                    if not data[0]:
-                        messagebox.showwarning(
-                            "Missing Name", "Merchant name is required."
-                        )
+                    data = {field: var.get().strip() for field, var in vars.items()}
+                    if not data["name"]:
+                        error_label.configure(text="Merchant name is required.")
+                        error_label.grid(row=error_row, column=0, columnspan=2, pady=(0, 6))
                         return
                     notes = notes_box.get("1.0", "end-1c").strip()
-                    bsa_settings.add_merchant_full(*data, notes)
+                    bsa_settings.add_merchant_full(
+                        data["root"],
+                        data["name"],
+                        co=data["co"],
+                        address=data["address"],
+                        city=data["city"],
+                        state=data["state"],
+                        zip_code=data["zip"],
+                        notes=notes,
+                    )
                     popup.destroy()
                     current_popup["window"] = None
-                    refresh_table()
+                    refresh_table(dirty=True)
 
             else:
                 # (Keep your exclusion popup code the same as before)
@@ -927,37 +1097,39 @@ def set_content(mode):
                 popup.geometry("400x310")
                 entity_var = ctk.StringVar()
                 reason_var = ctk.StringVar()
-                ctk.CTkLabel(popup, text="Excluded Entity:", font=("Arial", 13)).pack(
+                ctk.CTkLabel(popup, text="Excluded Entity:", font=FONT_FIELD).pack(
                     pady=(10, 2), anchor="w", padx=18
                 )
-                ctk.CTkEntry(popup, textvariable=entity_var, width=320).pack(
+                ctk.CTkEntry(popup, textvariable=entity_var, width=320, font=FONT_FIELD).pack(
                     pady=2, padx=18
                 )
-                ctk.CTkLabel(popup, text="Reason:", font=("Arial", 13)).pack(
+                ctk.CTkLabel(popup, text="Reason:", font=FONT_FIELD).pack(
                     pady=(6, 2), anchor="w", padx=18
                 )
-                ctk.CTkEntry(popup, textvariable=reason_var, width=320).pack(
+                ctk.CTkEntry(popup, textvariable=reason_var, width=320, font=FONT_FIELD).pack(
                     pady=2, padx=18
                 )
-                ctk.CTkLabel(popup, text="Notes:", font=("Arial", 13)).pack(
+                ctk.CTkLabel(popup, text="Notes:", font=FONT_FIELD).pack(
                     pady=2, anchor="w", padx=18
                 )
-                notes_box = ctk.CTkTextbox(popup, width=320, height=48)
+                notes_box = ctk.CTkTextbox(popup, width=320, height=48, font=FONT_FIELD)
                 notes_box.pack(pady=2, padx=18)
+                error_label = ctk.CTkLabel(
+                    popup, text="", font=FONT_FIELD, text_color="#c0392b"
+                )
 
                 def add_and_close():
                     entity = entity_var.get().strip()
                     reason = reason_var.get().strip()
                     notes = notes_box.get("1.0", "end-1c").strip()
                     if not entity:
-                        messagebox.showwarning(
-                            "Missing Entity", "Excluded entity is required."
-                        )
+                        error_label.configure(text="Excluded entity is required.")
+                        error_label.pack(before=btnf, pady=(6, 0))
                         return
                     bsa_settings.add_exclusion(entity, reason, notes)
                     popup.destroy()
                     current_popup["window"] = None
-                    refresh_table()
+                    refresh_table(dirty=True)
 
                 btnf = ctk.CTkFrame(popup, fg_color="white", corner_radius=0)
                 btnf.pack(pady=14)
@@ -985,21 +1157,31 @@ def set_content(mode):
                     popup.destroy(),
                 ),
             )
+            # Grab only once the widgets are laid out, so Tk measures the window once
+            popup.update_idletasks()
+            popup.grab_set()
+            popup.lift()
+            popup.focus_force()
 
         def delete_items_selected():
-            to_delete = [
-                mid for mid, var in set_content.checkbox_vars.items() if var.get()
-            ]
+            to_delete = [int(iid) for iid in tree.selection()]
             if not to_delete:
                 messagebox.showwarning("Delete", "No items selected.")
                 return
             msg = f"Delete {len(to_delete)} selected?"
             if messagebox.askyesno("Confirm Delete", msg):
+                # Cached rows still match the DB if nobody else wrote to it since
+                in_sync = not table_cache["dirty"] and db_mtime() == table_cache["mtime"]
                 if list_mode == "mp":
                     bsa_settings.delete_merchants_by_ids(to_delete)
                 else:
                     bsa_settings.delete_exclusions_by_ids(to_delete)
-                refresh_table()
+                if in_sync:
+                    # Drop the rows locally instead of re-reading the whole table
+                    deleted = set(to_delete)
+                    table_cache["items"] = [r for r in table_cache["items"] if r[0] not in deleted]
+                    table_cache["mtime"] = db_mtime()
+                refresh_table(dirty=not in_sync)
 
         # --- Add/Delete buttons ---
         ctrl = ctk.CTkFrame(content, fg_color="white", corner_radius=0)
@@ -1023,7 +1205,7 @@ def set_content(mode):
 
         ctk.CTkLabel(
             content,
-            text="• Click a merchant name to edit all fields. Use checkboxes and Delete to remove. Add to create new.",
+            text="• Double-click a merchant to edit all fields. Select rows (Ctrl/Shift-click) and Delete to remove. Add to create new.",
             font=("Arial", 12),
             text_color="#666",
         ).pack(pady=(8, 10))
@@ -1072,130 +1254,76 @@ def set_content(mode):
         )
         selected_label.pack(pady=5)
 
-        thinking_event = threading.Event()
-
-        def draw_jumping_letters(idx=0):
-            if not jumping_canvas.winfo_exists():
-                return
-            jumping_canvas.delete("all")
-            base_y = 25
-            jump_height = 12
-            font_size = 26
-            font = ("Arial", font_size, "bold")
-            spacing = 0
-            char_widths = []
-            for char in jumping_text:
-                char_widths.append(15 if char != " " else 12)
-            total_width = sum(char_widths) + spacing * (len(jumping_text) - 1)
-            start_x = (canvas_width - total_width) // 2 + 5
-            x = start_x
-            for i, char in enumerate(jumping_text):
-                y = base_y - jump_height if i == idx else base_y
-                jumping_canvas.create_text(x, y, text=char, fill="#1e9148", font=font)
-                x += char_widths[i] + spacing
-
-        def animate_jumping_letters():
-            idx = 0
-            if not jumping_canvas.winfo_exists():
-                return
-            jumping_canvas.pack(pady=(8, 12))
-            try:
-                while not thinking_event.is_set():
-                    if not jumping_canvas.winfo_exists():
-                        return
-                    draw_jumping_letters(idx)
-                    idx = (idx + 1) % len(jumping_text)
-                    time.sleep(0.13)
-            finally:
-                if jumping_canvas.winfo_exists():
-                    jumping_canvas.delete("all")
-                    jumping_canvas.pack_forget()
+        start_jumping_letters, stop_jumping_letters = make_jump_animator(
+            jumping_canvas, jumping_text, "#1e9148", content
+        )
 
         # --- END JUMPING LETTERS ANIMATION ---
 
         def run_evg_splitter(filepaths):
-            try:
-                import evg_splitter
-                # Redaction helper (optional)
-                try:
-                    import contract_redactor
-                except Exception:
-                    contract_redactor = None
+            import evg_splitter
+            contract_redactor = optional_import("contract_redactor")  # redaction helper
+
+            # Created per run: the user may have removed the folder since the last one
+            os.makedirs(EVG_OUTPUT_ROOT, exist_ok=True)
+            for file in filepaths:
+                save_dir = evg_splitter.split_recovery_pdf(file, output_dir=EVG_OUTPUT_ROOT)
+                # If Mulligan Funding contract detected, auto-redact page 5 sensitive fields
+                if contract_redactor and isinstance(save_dir, str) and os.path.isdir(save_dir):
+                    try:
+                        with os.scandir(save_dir) as entries:
+                            for entry in entries:
+                                if not entry.name.lower().endswith(" contract.pdf"):
+                                    continue
+                                # Redact only if it's a Mulligan Funding contract
+                                try:
+                                    contract_redactor.redact_if_mulligan(
+                                        entry.path, page_number=5
+                                    )
+                                except Exception:
+                                    # continue processing others; errors surface via general flow
+                                    pass
+                    except Exception:
+                        pass
 
-                output_root = os.path.join(
-                    os.path.expanduser("~"), "Desktop", "RSG Recovery Tools data output"
+        def notify_when_done():
+            stop_jumping_letters()
+            try:
+                messagebox.showinfo(
+                    "EVG Split Complete", f"Split files saved under:\n{EVG_OUTPUT_ROOT}"
                 )
-                os.makedirs(output_root, exist_ok=True)
-                for file in filepaths:
-                    save_dir = evg_splitter.split_recovery_pdf(file, output_dir=output_root)
-                    # If Mulligan Funding contract detected, auto-redact page 5 sensitive fields
-                    if contract_redactor and isinstance(save_dir, str) and os.path.isdir(save_dir):
-                        try:
-                            for fname in os.listdir(save_dir):
-                                if fname.lower().endswith(" contract.pdf"):
-                                    cpath = os.path.join(save_dir, fname)
-                                    # Redact only if it's a Mulligan Funding contract
-                                    try:
-                                        contract_redactor.redact_if_mulligan(cpath, page_number=5)
-                                    except Exception:
-                                        # continue processing others; errors surface via general flow
-                                        pass
-                        except Exception:
-                            pass
-            finally:
-                thinking_event.set()
+            except Exception:
+                pass
+
+        def start_splitting(filepaths):
+            selected_label.configure(text=f"{len(filepaths)} file(s) queued…")
+            start_jumping_letters()
+            start_worker("evg", run_evg_splitter, filepaths, on_done=notify_when_done)
 
         def on_drop(event):
-            filepaths = app.tk.splitlist(event.data)
-            filepaths = [p for p in filepaths if str(p).lower().endswith('.pdf')]
+            if _busy["evg"]:
+                return
+            filepaths = list(filter(is_pdf, app.tk.splitlist(event.data)))
             if not filepaths:
                 messagebox.showwarning("Invalid Drop", "Please drop one or more PDF files.")
                 return
-            selected_label.configure(text=f"{len(filepaths)} file(s) queued…")
-            thinking_event.clear()
-            threading.Thread(target=animate_jumping_letters, daemon=True).start()
-            threading.Thread(
-                target=run_evg_splitter, args=(filepaths,), daemon=True
-            ).start()
-            def notify_when_done():
-                if thinking_event.is_set():
-                    try:
-                        output_root = os.path.join(os.path.expanduser("~"), "Desktop", "RSG Recovery Tools data output")
-                        messagebox.showinfo("EVG Split Complete", f"Split files saved under:\n{output_root}")
-                    except Exception:
-                        pass
-                else:
-                    content.after(250, notify_when_done)
-            content.after(250, notify_when_done)
+            start_splitting(filepaths)
 
         drop_frame.drop_target_register(DND_FILES)
         drop_frame.dnd_bind("<<Drop>>", on_drop)
 
         def browse_files():
+            if _busy["evg"]:
+                return
             filepaths = filedialog.askopenfilenames(
                 title="Select EVG Recovery PDF(s)", filetypes=[("PDF files", "*.pdf")]
             )
             if filepaths:
-                filepaths = [p for p in filepaths if str(p).lower().endswith('.pdf')]
+                filepaths = list(filter(is_pdf, filepaths))
                 if not filepaths:
                     messagebox.showwarning("Browse Files", "No PDF files selected.")
                     return
-                selected_label.configure(text=f"{len(filepaths)} file(s) queued…")
-                thinking_event.clear()
-                threading.Thread(target=animate_jumping_letters, daemon=True).start()
-                threading.Thread(
-                    target=run_evg_splitter, args=(filepaths,), daemon=True
-                ).start()
-                def notify_when_done():
-                    if thinking_event.is_set():
-                        try:
-                            output_root = os.path.join(os.path.expanduser("~"), "Desktop", "RSG Recovery Tools data output")
-                            messagebox.showinfo("EVG Split Complete", f"Split files saved under:\n{output_root}")
-                        except Exception:
-                            pass
-                    else:
-                        content.after(250, notify_when_done)
-                content.after(250, notify_when_done)
+                start_splitting(filepaths)
 
         ctk.CTkButton(
             content,
@@ -1204,7 +1332,7 @@ def set_content(mode):
             fg_color="#1e9148",
             hover_color="#18843d",
             text_color="white",
-            font=("Arial", 14, "bold"),
+            font=FONT_BTN,
             corner_radius=22,
             width=180,
         ).pack(pady=18)
@@ -1251,7 +1379,8 @@ def show_evg_splitter():
     set_content("evg_splitter")
 
 
-show_main_menu()
+# Build the first page once the event loop is idle, so the window frame paints first
+app.after_idle(show_main_menu)
 
 # --- Exit Button ---
 exit_btn = ctk.CTkButton(
@@ -1,37 +1,93 @@
 # main_app_pyqt.py
+import functools
 import os
 import sys
 import time
-import threading
-from typing import List
+from typing import Dict, List, Tuple
 from pathlib import Path
 
 from PIL import Image
 from PIL.ImageQt import ImageQt
 
 # Qt imports
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QUrl
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QUrl, QRunnable, QThreadPool
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QPixmap, QFont, QDesktopServices, QImage
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QPushButton, QFileDialog, QMessageBox, QStackedWidget, QFrame, QScrollArea,
-    QCheckBox, QLineEdit, QTextEdit, QGridLayout, QDialog, QDialogButtonBox, QComboBox, QSpinBox
+    QCheckBox, QLineEdit, QTextEdit, QGridLayout, QDialog, QDialogButtonBox, QComboBox, QSpinBox,
+    QProgressBar
 )
 
 # --- Your domain modules (unchanged) ---
-import bank_analyzer
 import bsa_settings
-# ai_analysis and evg_splitter are imported on-demand in handlers
+# bank_analyzer, ai_analysis and evg_splitter are imported on-demand in handlers
 
 
 APP_NAME = "RSG Recovery Tools"
+PDF_FILTER = "PDF files (*.pdf)"
+# Next to this module rather than the CWD, so launching from another folder still finds it
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
+
+# Shared button stylesheets, built once instead of per widget
+EXIT_BTN_QSS = """
+    QPushButton{
+        background:#0075c6; color:white; padding:6px 14px; border-radius:14px; font: 700 11px 'Arial';
+    }
+    QPushButton:hover{ background:#005a98; }
+"""
+MENU_BTN_QSS = """
+    QPushButton{
+        background:#0075c6; color:white; font: 700 12px 'Arial';
+        border-radius: 20px; padding:6px 14px;
+    }
+    QPushButton:hover{ background:#005a98; }
+"""
+# Applied once to the sidebar stack; buttons opt in via objectName (see _make_sidebar_button)
+ADMIN_TOOL_BTN_QSS = """
+    QPushButton#adminToolBtn{
+        background:#e9f2fb; color:#000; font: 700 13px 'Arial';
+        border-radius: 20px; padding:8px 14px;
+    }
+    QPushButton#adminToolBtn:hover{ background:#d4e8fb; }
+"""
+BIG_BTN_QSS = """
+    QPushButton{
+        background:#0075c6; color:white; font: 700 16px 'Arial';
+        border-radius: 30px;
+    }
+    QPushButton:hover{ background:#005a98; }
+"""
+
+
+def _pill_btn_qss(bg: str, hover: str, size: int = 14, radius: int = 22, pad: str = "8px 18px") -> str:
+    return f"""
+    QPushButton{{ background:{bg}; color:white; font: 700 {size}px 'Arial';
+                 border-radius: {radius}px; padding:{pad}; }}
+    QPushButton:hover{{ background:{hover}; }}
+"""
+
+
+BANK_BROWSE_QSS = _pill_btn_qss("#0075c6", "#005a98")
+AI_BROWSE_QSS = _pill_btn_qss("#ba0075", "#7e0059")
+EVG_BROWSE_QSS = _pill_btn_qss("#1e9148", "#18843d")
+AI_KEY_BTN_QSS = _pill_btn_qss("#ba0075", "#7e0059", size=12, radius=18, pad="6px 14px")
 
 
 # -----------------------------
 # Helpers / Shared Components
 # -----------------------------
+_PIXMAP_CACHE: Dict[Tuple[str, int], QPixmap] = {}
+
+
 def pil_to_qpixmap(path: str, max_size: int = 260) -> QPixmap:
-    """Load image (logo) and keep aspect ratio. Uses in-memory Pillow->QImage conversion."""
+    """Load image (logo) and keep aspect ratio. Uses in-memory Pillow->QImage conversion.
+
+    Scaled pixmaps are cached per (path, max_size), so rebuilding a page skips the decode.
+    """
+    key = (path, max_size)
+    if key in _PIXMAP_CACHE:
+        return _PIXMAP_CACHE[key]
     try:
         img = Image.open(path)
         w, h = img.size
@@ -43,19 +99,73 @@ def pil_to_qpixmap(path: str, max_size: int = 260) -> QPixmap:
             new_w = int(w * max_size / h)
         img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
         qimg = ImageQt(img)  # Pillow -> QImage adapter
-        return QPixmap.fromImage(qimg)
+        pm = QPixmap.fromImage(qimg)
+        _PIXMAP_CACHE[key] = pm
+        return pm
     except Exception:
         return QPixmap()
 
 
+@functools.lru_cache(maxsize=None)
+def _bank_analyzer():
+    """bank_analyzer pulls in pdfplumber/OCR deps; import it on first use, not at startup."""
+    import bank_analyzer
+    return bank_analyzer
+
+
+@functools.lru_cache(maxsize=None)
+def _ai_analysis():
+    """ai_analysis pulls in openai/reportlab; import it on first use, not at startup."""
+    import ai_analysis
+    return ai_analysis
+
+
+def bank_jobs() -> int:
+    """Worker processes for a multi-file bank run: BANK_JOBS, else half the cores.
+
+    Each statement may run Tesseract, which is multi-threaded itself, so one process
+    per core would oversubscribe the CPU.
+    """
+    try:
+        jobs = int(os.getenv("BANK_JOBS", "0"))
+    except ValueError:
+        jobs = 0
+    return jobs if jobs > 0 else max(1, (os.cpu_count() or 2) // 2)
+
+
+def get_openai_key() -> str:
+    """OPENAI_API_KEY from the environment (or a local .env), else config.openai_api_key."""
+    # optional dotenv for local dev
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except Exception:
+        pass
+
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    if not api_key:
+        try:
+            import config  # optional local file, ignored by git
+            api_key = getattr(config, "openai_api_key", "")
+        except Exception:
+            api_key = ""
+    return api_key
+
+
 class DropArea(QFrame):
-    """Reusable drag-and-drop frame that emits a signal with file paths."""
+    """Reusable drag-and-drop frame that emits a signal with file paths.
+
+    Only paths ending in one of accept_suffixes are emitted; the rest go out on `rejected`.
+    """
     filesDropped = pyqtSignal(list)
+    rejected = pyqtSignal(list)
 
-    def __init__(self, label_text: str, accent: str = "#0075c6", parent=None):
+    def __init__(self, label_text: str, accent: str = "#0075c6", parent=None,
+                 accept_suffixes=(".pdf",)):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self._accent = accent
+        self._accept_suffixes = tuple(accept_suffixes)
         self._base_style = f"""
             QFrame {{
                 background: rgba(0,0,0,0);
@@ -79,8 +189,12 @@ class DropArea(QFrame):
         self.lbl.setStyleSheet(f"color:{accent}; font: 14px 'Arial'; font-style: italic;")
         lay.addWidget(self.lbl)
 
+    def _accepts(self, path: str) -> bool:
+        return path.lower().endswith(self._accept_suffixes)
+
     def dragEnterEvent(self, e: QDragEnterEvent):
-        if e.mimeData().hasUrls():
+        # Leave the drag unaccepted (forbidden cursor) unless at least one file is usable
+        if any(self._accepts(url.toLocalFile()) for url in e.mimeData().urls()):
             e.acceptProposedAction()
             self.setStyleSheet(self._hover_style)
 
@@ -89,19 +203,31 @@ class DropArea(QFrame):
             e.acceptProposedAction()
 
     def dropEvent(self, e: QDropEvent):
-        paths = []
-        for url in e.mimeData().urls():
-            p = url.toLocalFile()
-            if p:
-                paths.append(p)
-        if paths:
-            self.filesDropped.emit(paths)
+        # toLocalFile() is "" for non-local URLs, so truthiness doubles as the isLocalFile() check
+        paths = [p for p in (url.toLocalFile() for url in e.mimeData().urls()) if p]
+        accepted = [p for p in paths if self._accepts(p)]
+        skipped = [p for p in paths if not self._accepts(p)]
+        if accepted:
+            self.filesDropped.emit(accepted)
+        if skipped:
+            self.rejected.emit(skipped)
         self.setStyleSheet(self._base_style)
 
     def dragLeaveEvent(self, e):
         self.setStyleSheet(self._base_style)
 
 
+class WorkerJob(QRunnable):
+    """Runs a worker callable on the window's shared QThreadPool."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self._fn = fn
+
+    def run(self):
+        self._fn()
+
+
 class ElipsisSpinner(QObject):
     """Tiny text spinner 'Thinking', 'Analyzing', 'Splitting' with dots."""
     tick = pyqtSignal(str)
@@ -135,6 +261,7 @@ class MainWindow(QMainWindow):
     bank_done = pyqtSignal()
     bank_error = pyqtSignal(str)
     bank_progress = pyqtSignal(str)
+    bank_file_progress = pyqtSignal(int, int)  # (files done, total)
     ai_done = pyqtSignal()
     ai_error = pyqtSignal(str)
     evg_done = pyqtSignal()
@@ -152,6 +279,15 @@ class MainWindow(QMainWindow):
         self.ai_preview_page_count: int = 0
         self.ai_preview_current_page: int = 0
         self.ai_zoom: float = 1.0
+        # Browse dialogs open where the user last picked files (not the process CWD)
+        self._last_browse_dir: str = os.path.expanduser("~")
+        # Resolved once; reload_key() / the Set Key dialog refresh it
+        self._openai_key: str = get_openai_key()
+        # Shared worker pool: threads are recycled across drops and concurrency stays bounded
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        # One run per tool at a time; cleared by the matching _on_*_done/_on_*_error slot
+        self._busy = {"bank": False, "ai": False, "evg": False}
 
         # Root container
         root = QWidget()
@@ -167,23 +303,29 @@ class MainWindow(QMainWindow):
 
         self.sidebarLayout = QVBoxLayout(self.sidebar)
         self.sidebarLayout.setContentsMargins(18, 18, 18, 18)
+        # One panel per sidebar mode, built on first use and switched rather than rebuilt
+        self.sidebar_stack = QStackedWidget()
+        self.sidebar_stack.setStyleSheet(ADMIN_TOOL_BTN_QSS)
+        self.sidebarLayout.addWidget(self.sidebar_stack)
+        self._sidebars: Dict[str, QWidget] = {}
         layout.addWidget(self.sidebar)
 
         # Content stack
         self.stack = QStackedWidget()
         layout.addWidget(self.stack, 1)
 
-        # Build pages
+        # Build the landing pages; tool pages are built on first visit (see _page)
         self.page_main = self._build_main_menu()
         self.page_admin = self._build_admin()
-        self.page_bank = self._build_bank_analyzer()
-        self.page_ai = self._build_ai_analyzer()
-        self.page_bsa = self._build_bsa_settings()
-        self.page_evg = self._build_evg_splitter()
-
-        # Add to stack
-        for page in [self.page_main, self.page_admin, self.page_bank, self.page_ai, self.page_bsa, self.page_evg]:
+        for page in [self.page_main, self.page_admin]:
             self.stack.addWidget(page)
+        self._page_factories = {
+            "bank_analyzer": self._build_bank_analyzer,
+            "ai_analyzer": self._build_ai_analyzer,
+            "bsa_settings": self._build_bsa_settings,
+            "evg_splitter": self._build_evg_splitter,
+        }
+        self._pages: Dict[str, QWidget] = {}
 
         # Top-level nav
         self._set_sidebar("main_menu")
@@ -191,12 +333,7 @@ class MainWindow(QMainWindow):
 
         # Exit button (bottom-right like your Tk `place`)
         exit_btn = QPushButton("Exit", self)
-        exit_btn.setStyleSheet("""
-            QPushButton{
-                background:#0075c6; color:white; padding:6px 14px; border-radius:14px; font: 700 11px 'Arial';
-            }
-            QPushButton:hover{ background:#005a98; }
-        """)
+        exit_btn.setStyleSheet(EXIT_BTN_QSS)
         exit_btn.clicked.connect(self.close)
         # Position using a floating layout trick
         self.statusBar().addPermanentWidget(exit_btn)
@@ -209,6 +346,14 @@ class MainWindow(QMainWindow):
         self.evg_done.connect(self._on_evg_done)
         self.evg_error.connect(self._on_evg_error)
         self.bank_progress.connect(self._on_bank_progress)
+        self.bank_file_progress.connect(self._on_bank_file_progress)
+
+        # Per-file progress for bank batches, shown in the status bar only while a run is active
+        self.bank_progress_bar = QProgressBar()
+        self.bank_progress_bar.setMaximumWidth(220)
+        self.bank_progress_bar.setFormat("%v/%m files")
+        self.bank_progress_bar.hide()
+        self.statusBar().addWidget(self.bank_progress_bar)
 
         # Brief status timer to clear completion text on the bank analyzer page
         self._bank_status_timer = QTimer(self)
@@ -217,34 +362,30 @@ class MainWindow(QMainWindow):
         self._bank_status_timer.timeout.connect(lambda: self.bank_spinner_label.setText(""))
 
     # ---------------- Sidebar ----------------
-    def _clear_sidebar(self):
-        while self.sidebarLayout.count():
-            item = self.sidebarLayout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
     def _set_sidebar(self, mode: str):
-        self._clear_sidebar()
+        panel = self._sidebars.get(mode)
+        if panel is None:
+            panel = self._sidebars[mode] = self._build_sidebar(mode)
+            self.sidebar_stack.addWidget(panel)
+        self.sidebar_stack.setCurrentWidget(panel)
+
+    def _build_sidebar(self, mode: str) -> QWidget:
+        panel = QWidget()
+        lay = QVBoxLayout(panel)
+        lay.setContentsMargins(0, 0, 0, 0)
         if mode == "main_menu":
-            return
+            return panel
 
         def add_label(text, color):
             lab = QLabel(text)
             lab.setStyleSheet(f"color:{color}; font: 700 18px 'Arial';")
-            self.sidebarLayout.addWidget(lab)
+            lay.addWidget(lab)
 
         btn = QPushButton("Main Menu")
-        btn.setStyleSheet("""
-            QPushButton{
-                background:#0075c6; color:white; font: 700 12px 'Arial';
-                border-radius: 20px; padding:6px 14px;
-            }
-            QPushButton:hover{ background:#005a98; }
-        """)
+        btn.setStyleSheet(MENU_BTN_QSS)
         btn.clicked.connect(lambda: self.show_page("main_menu"))
-        self.sidebarLayout.addWidget(btn)
-        self.sidebarLayout.addSpacing(10)
+        lay.addWidget(btn)
+        lay.addSpacing(10)
 
         label_map = {"admin": ("Admin", "#0075c6"),
                      "collections": ("Collections", "#0075c6"),
@@ -259,17 +400,15 @@ class MainWindow(QMainWindow):
                 ("AI Statement Analysis", lambda: self.show_page("ai_analyzer")),
                 ("BSA Settings", lambda: self.show_page("bsa_settings")),
             ]:
-                b = QPushButton(text)
-                b.setStyleSheet("""
-                    QPushButton{
-                        background:#e9f2fb; color:#000; font: 700 13px 'Arial';
-                        border-radius: 20px; padding:8px 14px;
-                    }
-                    QPushButton:hover{ background:#d4e8fb; }
-                """)
-                b.clicked.connect(handler)
-                self.sidebarLayout.addWidget(b)
-        self.sidebarLayout.addStretch(1)
+                lay.addWidget(self._make_sidebar_button(text, handler))
+        lay.addStretch(1)
+        return panel
+
+    def _make_sidebar_button(self, text: str, handler) -> QPushButton:
+        b = QPushButton(text)
+        b.setObjectName("adminToolBtn")  # styled by the sheet on sidebar_stack
+        b.clicked.connect(handler)
+        return b
 
     # ---------------- Pages ----------------
     def _build_main_menu(self) -> QWidget:
@@ -279,7 +418,7 @@ class MainWindow(QMainWindow):
         v.setContentsMargins(20, 20, 20, 20)
 
         # Logo
-        pm = pil_to_qpixmap("logo.png", max_size=260)
+        pm = pil_to_qpixmap(LOGO_PATH, max_size=260)
         if not pm.isNull():
             img = QLabel()
             img.setPixmap(pm)
@@ -301,13 +440,7 @@ class MainWindow(QMainWindow):
             b = QPushButton(text)
             b.setFixedWidth(320)
             b.setFixedHeight(44)
-            b.setStyleSheet("""
-                QPushButton{
-                    background:#0075c6; color:white; font: 700 16px 'Arial';
-                    border-radius: 30px;
-                }
-                QPushButton:hover{ background:#005a98; }
-            """)
+            b.setStyleSheet(BIG_BTN_QSS)
             b.clicked.connect(cb)
             v.addWidget(b, alignment=Qt.AlignmentFlag.AlignHCenter)
             v.addSpacing(12)
@@ -358,11 +491,7 @@ class MainWindow(QMainWindow):
         self._bank_spinner = spinner
 
         browse = QPushButton("Browse Files")
-        browse.setStyleSheet("""
-            QPushButton{ background:#0075c6; color:white; font: 700 14px 'Arial';
-                         border-radius: 22px; padding:8px 18px; }
-            QPushButton:hover{ background:#005a98; }
-        """)
+        browse.setStyleSheet(BANK_BROWSE_QSS)
         v.addSpacing(6)
         v.addWidget(browse, alignment=Qt.AlignmentFlag.AlignHCenter)
 
@@ -380,45 +509,78 @@ class MainWindow(QMainWindow):
             self._start_bank_analysis(pdfs)
 
         def on_browse():
-            paths, _ = QFileDialog.getOpenFileNames(self, "Select Bank Statement PDFs",
-                                                    filter="PDF files (*.pdf)")
+            paths = self._browse_pdfs("Select Bank Statement PDFs")
             if paths:
                 self._start_bank_analysis(paths)
 
         drop.filesDropped.connect(on_files)
+        drop.rejected.connect(self._on_drop_rejected)
         browse.clicked.connect(on_browse)
         return page
 
     def _start_bank_analysis(self, paths: List[str]):
+        if self._already_running("bank"):
+            return
+        self._busy["bank"] = True
+        self.bank_progress_bar.setRange(0, len(paths))
+        self.bank_progress_bar.setValue(0)
+        self.bank_progress_bar.show()
         # spinner
         self._bank_spinner.start()
+        ocr_first = self.chk_ocr_first.isChecked()
+
         def work():
+            # Respect OCR-first toggle via environment variable for current process
+            prev = os.getenv("BANK_OCR_FIRST")
+            if ocr_first:
+                os.environ["BANK_OCR_FIRST"] = "1"
+            else:
+                os.environ.pop("BANK_OCR_FIRST", None)
             try:
-                # Respect OCR-first toggle via environment variable for current process
-                prev = os.getenv("BANK_OCR_FIRST")
-                if self.chk_ocr_first.isChecked():
-                    os.environ["BANK_OCR_FIRST"] = "1"
-                else:
-                    if "BANK_OCR_FIRST" in os.environ:
-                        del os.environ["BANK_OCR_FIRST"]
+                bank_analyzer = _bank_analyzer()
+
                 # Emit progress safely from worker via signal
                 def _progress(msg: str):
                     try:
                         self.bank_progress.emit(msg)
                     except Exception:
                         pass
-                bank_analyzer.process_bank_statements_full(paths, None, progress_cb=_progress)
-                # restore
-                if prev is not None:
-                    os.environ["BANK_OCR_FIRST"] = prev
+
+                jobs = min(len(paths), bank_jobs())
+                if jobs <= 1:
+                    bank_analyzer.process_bank_statements_full(
+                        paths, None, progress_cb=_progress, on_progress=self.bank_file_progress.emit
+                    )
                 else:
-                    if "BANK_OCR_FIRST" in os.environ:
-                        del os.environ["BANK_OCR_FIRST"]
+                    # Parsing/OCR is CPU-bound (and PyMuPDF is not thread-safe), so fan the
+                    # statements out to worker processes; they inherit BANK_OCR_FIRST above.
+                    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+                    total = len(paths)
+                    _progress(f"Processing {total} statements in {jobs} processes…")
+                    with ProcessPoolExecutor(max_workers=jobs) as ex:
+                        futures = [ex.submit(bank_analyzer.process_bank_statements_full, [p])
+                                   for p in paths]
+                        for done, fut in enumerate(as_completed(futures), start=1):
+                            fut.result()
+                            _progress(f"Processed {done}/{total}")
+                            self.bank_file_progress.emit(done, total)
             except Exception as e:
-                self.bank_error.emit(str(e))
+                error = str(e)
             else:
+                error = None
+            finally:
+                # restore, even when a statement failed, before the UI can start the next run
+                if prev is not None:
+                    os.environ["BANK_OCR_FIRST"] = prev
+                else:
+                    os.environ.pop("BANK_OCR_FIRST", None)
+            if error is None:
                 self.bank_done.emit()
-        threading.Thread(target=work, daemon=True).start()
+            else:
+                self.bank_error.emit(error)
+
+        self.pool.start(WorkerJob(work))
 
     # ---- AI Analyzer ----
     def _build_ai_analyzer(self) -> QWidget:
@@ -446,11 +608,7 @@ class MainWindow(QMainWindow):
         self._ai_spinner = spinner
 
         browse = QPushButton("Browse Files")
-        browse.setStyleSheet("""
-            QPushButton{ background:#ba0075; color:white; font: 700 14px 'Arial';
-                         border-radius: 22px; padding:8px 18px; }
-            QPushButton:hover{ background:#7e0059; }
-        """)
+        browse.setStyleSheet(AI_BROWSE_QSS)
         v.addSpacing(6)
         v.addWidget(browse, alignment=Qt.AlignmentFlag.AlignHCenter)
 
@@ -458,21 +616,17 @@ class MainWindow(QMainWindow):
             self._start_ai_analysis(paths)
 
         def on_browse():
-            paths, _ = QFileDialog.getOpenFileNames(self, "Select Bank Statement PDFs",
-                                                    filter="PDF files (*.pdf)")
+            paths = self._browse_pdfs("Select Bank Statement PDFs")
             if paths:
                 self._start_ai_analysis(paths)
 
         drop.filesDropped.connect(on_files)
+        drop.rejected.connect(self._on_drop_rejected)
         browse.clicked.connect(on_browse)
 
         # Dedicated button to set/save OpenAI API key (belongs to AI page)
         set_key = QPushButton("Set/OpenAI Key")
-        set_key.setStyleSheet("""
-            QPushButton{ background:#ba0075; color:white; font: 700 12px 'Arial';
-                         border-radius: 18px; padding:6px 14px; }
-            QPushButton:hover{ background:#7e0059; }
-        """)
+        set_key.setStyleSheet(AI_KEY_BTN_QSS)
         v.addWidget(set_key, alignment=Qt.AlignmentFlag.AlignHCenter)
 
         def on_set_key():
@@ -544,20 +698,9 @@ class MainWindow(QMainWindow):
         return page
 
     def _start_ai_analysis(self, paths: List[str]):
-        # optional dotenv for local dev
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except Exception:
-            pass
-
-        api_key = os.getenv("OPENAI_API_KEY", "")
-        if not api_key:
-            try:
-                import config  # optional local file, ignored by git
-                api_key = getattr(config, "openai_api_key", "")
-            except Exception:
-                api_key = ""
+        if self._already_running("ai"):
+            return
+        api_key = self._openai_key or self.reload_key()
         if not api_key:
             # Prompt user to paste key and save to .env
             api_key = self._prompt_openai_key_and_save()
@@ -570,7 +713,7 @@ class MainWindow(QMainWindow):
 
         # Pre-compute where outputs will be written so we can inform the user on completion
         try:
-            import ai_analysis as _ai_for_paths
+            _ai_for_paths = _ai_analysis()
             out_dirs = [str(_ai_for_paths.get_statement_subfolder(p)) for p in paths]
             summaries = []
             dir_to_summary = {}
@@ -599,16 +742,21 @@ class MainWindow(QMainWindow):
         self._ai_expected_summaries = summaries
         self._ai_dir_to_summary = dir_to_summary
 
+        self._busy["ai"] = True
         self._ai_spinner.start()
         def work():
             try:
-                import ai_analysis
-                ai_analysis.process_bank_statements_ai(paths, api_key, None)
+                _ai_analysis().process_bank_statements_ai(paths, api_key, None)
             except Exception as e:
                 self.ai_error.emit(str(e))
             else:
                 self.ai_done.emit()
-        threading.Thread(target=work, daemon=True).start()
+        self.pool.start(WorkerJob(work))
+
+    def reload_key(self) -> str:
+        """Re-read the OpenAI key (env, .env, config.py) without restarting the app."""
+        self._openai_key = get_openai_key()
+        return self._openai_key
 
     def _prompt_openai_key_and_save(self) -> str:
         """Prompt for API key, save to .env next to this file, set env var, and return the key (or empty)."""
@@ -646,6 +794,7 @@ class MainWindow(QMainWindow):
             try:
                 self._write_env_key("OPENAI_API_KEY", k)
                 os.environ["OPENAI_API_KEY"] = k
+                self._openai_key = k
                 result_key = k
                 dlg.accept()
             except Exception as e:
@@ -987,11 +1136,7 @@ class MainWindow(QMainWindow):
         self._evg_spinner = spinner
 
         browse = QPushButton("Browse Files")
-        browse.setStyleSheet("""
-            QPushButton{ background:#1e9148; color:white; font: 700 14px 'Arial';
-                         border-radius: 22px; padding:8px 18px; }
-            QPushButton:hover{ background:#18843d; }
-        """)
+        browse.setStyleSheet(EVG_BROWSE_QSS)
         v.addSpacing(6)
         v.addWidget(browse, alignment=Qt.AlignmentFlag.AlignHCenter)
 
@@ -999,16 +1144,19 @@ class MainWindow(QMainWindow):
             self._start_evg_split(paths)
 
         def on_browse():
-            paths, _ = QFileDialog.getOpenFileNames(self, "Select EVG Recovery PDF(s)",
-                                                    filter="PDF files (*.pdf)")
+            paths = self._browse_pdfs("Select EVG Recovery PDF(s)")
             if paths:
                 self._start_evg_split(paths)
 
         drop.filesDropped.connect(on_files)
+        drop.rejected.connect(self._on_drop_rejected)
         browse.clicked.connect(on_browse)
         return page
 
     def _start_evg_split(self, paths: List[str]):
+        if self._already_running("evg"):
+            return
+        self._busy["evg"] = True
         self._evg_spinner.start()
         def work():
             try:
@@ -1038,9 +1186,16 @@ class MainWindow(QMainWindow):
                 self.evg_error.emit(str(e))
             else:
                 self.evg_done.emit()
-        threading.Thread(target=work, daemon=True).start()
+        self.pool.start(WorkerJob(work))
 
     # ---------------- Misc ----------------
+    def _browse_pdfs(self, title: str) -> List[str]:
+        paths, _ = QFileDialog.getOpenFileNames(self, title, self._last_browse_dir, PDF_FILTER,
+                                                options=QFileDialog.Option.ReadOnly)
+        if paths:
+            self._last_browse_dir = os.path.dirname(paths[0])
+        return paths
+
     def _subtitle(self, text: str, color: str = "#333") -> QLabel:
         lab = QLabel(text)
         lab.setStyleSheet(f"color:{color}; font: 16px 'Arial';")
@@ -1060,26 +1215,27 @@ class MainWindow(QMainWindow):
         elif key == "sales":
             self._set_sidebar("sales")
             self.stack.setCurrentWidget(self.page_admin)
-        elif key == "bank_analyzer":
-            self._set_sidebar("admin")
-            self.stack.setCurrentWidget(self.page_bank)
-        elif key == "ai_analyzer":
-            self._set_sidebar("admin")
-            self.stack.setCurrentWidget(self.page_ai)
-        elif key == "bsa_settings":
-            self._set_sidebar("admin")
-            self.stack.setCurrentWidget(self.page_bsa)
-        elif key == "evg_splitter":
+        elif key in self._page_factories:
             self._set_sidebar("admin")
-            self.stack.setCurrentWidget(self.page_evg)
+            self.stack.setCurrentWidget(self._page(key))
+
+    def _page(self, key: str) -> QWidget:
+        """Return the tool page for key, building it and adding it to the stack on first use."""
+        page = self._pages.get(key)
+        if page is None:
+            page = self._pages[key] = self._page_factories[key]()
+            self.stack.addWidget(page)
+        return page
 
     # ---------------- Worker signal handlers (main thread) ----------------
     def _on_bank_done(self):
+        self._busy["bank"] = False
+        self.bank_progress_bar.hide()
         self._bank_spinner.stop()
         try:
             # Show a friendly completion message and where to find results
             try:
-                output_path = bank_analyzer.get_desktop_output_folder()
+                output_path = _bank_analyzer().get_desktop_output_folder()
             except Exception:
                 output_path = os.path.join(os.path.expanduser('~'), 'Desktop', 'RSG Recovery Tools data output')
             self.bank_spinner_label.setText("Complete!")
@@ -1091,10 +1247,13 @@ class MainWindow(QMainWindow):
             pass
 
     def _on_bank_error(self, msg: str):
+        self._busy["bank"] = False
+        self.bank_progress_bar.hide()
         self._bank_spinner.stop()
         QMessageBox.critical(self, "Bank Analyzer Error", msg)
 
     def _on_ai_done(self):
+        self._busy["ai"] = False
         self._ai_spinner.stop()
         # Auto-open first result folder if enabled
         try:
@@ -1123,10 +1282,12 @@ class MainWindow(QMainWindow):
             pass
 
     def _on_ai_error(self, msg: str):
+        self._busy["ai"] = False
         self._ai_spinner.stop()
         QMessageBox.critical(self, "AI Analysis Error", msg)
 
     def _on_evg_done(self):
+        self._busy["evg"] = False
         self._evg_spinner.stop()
         try:
             output_path = os.path.join(os.path.expanduser("~"), "Desktop", "RSG Recovery Tools data output")
@@ -1136,12 +1297,26 @@ class MainWindow(QMainWindow):
             pass
 
     def _on_evg_error(self, msg: str):
+        self._busy["evg"] = False
         self._evg_spinner.stop()
         QMessageBox.critical(self, "EVG Splitter Error", msg)
 
+    def _already_running(self, key: str) -> bool:
+        if self._busy[key]:
+            self.statusBar().showMessage("Still working on the previous batch; try again when it finishes.", 5000)
+            return True
+        return False
+
+    def _on_drop_rejected(self, paths: List[str]):
+        self.statusBar().showMessage(f"Skipped {len(paths)} non-PDF item(s)", 5000)
+
     def _on_bank_progress(self, msg: str):
         self.bank_progress_label.setText(msg)
 
+    def _on_bank_file_progress(self, done: int, total: int):
+        self.bank_progress_bar.setRange(0, total)
+        self.bank_progress_bar.setValue(done)
+
     def _show_ai_result_dialog(self, paths: List[str]):
         dlg = QDialog(self)
         dlg.setWindowTitle("AI Analysis Complete")
@@ -1260,8 +1435,7 @@ class MainWindow(QMainWindow):
                 from pdf2image import convert_from_path
                 # Reuse poppler path helper from bank_analyzer if available
                 try:
-                    import bank_analyzer as _ba
-                    poppler_path = _ba.get_poppler_path()
+                    poppler_path = _bank_analyzer().get_poppler_path()
                 except Exception:
                     poppler_path = None
 
@@ -1353,8 +1527,19 @@ def main():
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
+    # Warm the analyzer imports off the UI thread so the first drop doesn't pay for them
+    def prewarm():
+        for getter in (_bank_analyzer, _ai_analysis):
+            try:
+                getter()
+            except Exception:
+                pass  # surfaced by the handler that actually needs the module
+    win.pool.start(WorkerJob(prewarm))
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()  # bank analysis spawns worker processes
     main()
@@ -23,3 +23,23 @@ def test_sum_deposits_and_accounts_totals():
     assert total == 150.00
     assert a_totals["9876"]["qty"] == 1
     assert a_totals["9876"]["total"] == 25.00
+
+
+def test_process_bank_statements_ai_overlaps_statements(monkeypatch, tmp_path):
+    import threading
+
+    import ai_analysis
+
+    seen = []
+    # Each stub call waits for two others, so a serial loop breaks the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_analyze(path, key, subfolder):
+        barrier.wait()
+        seen.append((path, key))
+
+    monkeypatch.setenv("OPENAI_MAX_CONCURRENCY", "3")
+    monkeypatch.setattr(ai_analysis, "gpt_analyze_bank_statement", fake_analyze)
+    files = [str(tmp_path / f"stmt{i}.pdf") for i in range(6)]
+    ai_analysis.process_bank_statements_ai(files, "sk-test")
+    assert sorted(seen) == [(f, "sk-test") for f in files]
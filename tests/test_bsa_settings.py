@@ -0,0 +1,56 @@
+import bsa_settings
+
+
+def test_merchant_import_export_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(bsa_settings, "DB_NAME", str(tmp_path / "db.sqlite"))
+    src = tmp_path / "in.txt"
+    src.write_text(
+        "root,name,co,address,city,state,zip,notes\n"
+        " Acme , Acme Pay ,,1 Main St,Austin,TX,78701,first\n"
+        "Beta,Beta Card\n"
+        "Dup,Acme Pay,,,,,,ignored\n"
+        "short\n",
+        encoding="utf-8",
+    )
+    bsa_settings.import_merchants_txt(str(src))
+
+    rows = bsa_settings.get_all_merchants_with_ids()
+    assert [r[1:] for r in rows] == [
+        ("Acme", "Acme Pay", "", "1 Main St", "Austin", "TX", "78701", "first"),
+        ("Beta", "Beta Card", "", "", "", "", "", ""),
+    ]
+
+    out = tmp_path / "out.txt"
+    bsa_settings.export_merchants_txt(str(out))
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "root,name,co,address,city,state,zip,notes"
+    assert lines[1:] == [
+        "Acme,Acme Pay,,1 Main St,Austin,TX,78701,first",
+        "Beta,Beta Card,,,,,,",
+    ]
+
+
+def test_exclusion_import_skips_header_and_duplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(bsa_settings, "DB_NAME", str(tmp_path / "db.sqlite"))
+    src = tmp_path / "in.txt"
+    src.write_text(
+        "entity,reason,notes\nFoo LLC,owner\nFoo LLC,again\n", encoding="utf-8"
+    )
+    bsa_settings.import_exclusions_txt(str(src))
+
+    assert [r[1:] for r in bsa_settings.get_all_exclusions_with_ids()] == [
+        ("Foo LLC", "owner", "")
+    ]
+
+
+def test_delete_by_ids_removes_only_given_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(bsa_settings, "DB_NAME", str(tmp_path / "db.sqlite"))
+    monkeypatch.setattr(bsa_settings, "_DELETE_CHUNK", 2)  # exercise chunking
+    for i in range(5):
+        bsa_settings.add_merchant_full("", f"M{i}")
+    ids = {r[2]: r[0] for r in bsa_settings.get_all_merchants_with_ids()}
+
+    bsa_settings.delete_merchants_by_ids([ids["M0"], ids["M2"], ids["M3"]])
+    bsa_settings.delete_merchants_by_ids([])
+
+    assert [r[2] for r in bsa_settings.get_all_merchants_with_ids()] == ["M1", "M4"]
@@ -0,0 +1,80 @@
+from contract_redactor import _contains_digits
+
+
+def test_contains_digits_counts_ascii_digits():
+    assert _contains_digits("12-3456789", 9)
+    assert not _contains_digits("12-34567", 9)
+    assert _contains_digits("xx1234", 4)
+    assert not _contains_digits("Account", 1)
+    assert _contains_digits("", 0)
+
+
+def _word(x0, x1, text):
+    return (x0, 0.0, x1, 10.0, text, 0, 0, 0)
+
+
+def test_label_right_edges_single_scan_per_line():
+    from contract_redactor import _label_right_edges
+
+    line = [
+        _word(0, 40, "Routing"),
+        _word(45, 90, "Number:"),
+        _word(95, 150, "021000021"),
+        _word(160, 200, "Account"),
+        _word(205, 240, "Number:"),
+        _word(245, 300, "123456789"),
+    ]
+    edges = _label_right_edges(line)
+    assert edges["routing"] == 90
+    assert edges["account"] == 240
+    assert "ein" not in edges
+
+
+def _make_contract(path, pages=5, lender="Mulligan Funding LLC"):
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{lender} Agreement, page {i + 1}")
+        if i == 4:
+            page.insert_text((72, 120), "Federal Tax ID: 12-3456789")
+            page.insert_text((72, 150), "Routing Number: 021000021")
+            page.insert_text((72, 180), "Account Number: 123456789")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_redact_if_mulligan_redacts_target_page(tmp_path):
+    import fitz
+
+    from contract_redactor import redact_if_mulligan
+
+    src = tmp_path / "Acme Contract.pdf"
+    _make_contract(src)
+    result = redact_if_mulligan(str(src))
+
+    assert result == {"page_index": 4, "redactions": 3}
+    with fitz.open(str(tmp_path / "Acme Contract - Redacted.pdf")) as doc:
+        text = doc[4].get_text()
+    for value in ("12-3456789", "021000021", "123456789"):
+        assert value not in text
+    assert "Routing Number" in text
+
+
+def test_redact_if_mulligan_skips_other_lenders(tmp_path):
+    from contract_redactor import redact_if_mulligan
+
+    src = tmp_path / "Other Contract.pdf"
+    _make_contract(src, lender="Other Capital")
+    assert redact_if_mulligan(str(src)) is None
+    assert not (tmp_path / "Other Contract - Redacted.pdf").exists()
+
+
+def test_redact_if_mulligan_short_pdf_returns_none(tmp_path):
+    from contract_redactor import redact_if_mulligan
+
+    src = tmp_path / "Short Contract.pdf"
+    _make_contract(src, pages=3)
+    assert redact_if_mulligan(str(src), page_number=5) is None
+    assert not (tmp_path / "Short Contract - Redacted.pdf").exists()
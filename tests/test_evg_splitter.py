@@ -0,0 +1,176 @@
+import os
+import time
+
+import pytest
+
+from evg_splitter import colorize_line, extract_datetime_from_text
+
+
+def _kinds(line):
+    return [(text, kind) for text, _, _, _, _, kind in colorize_line(line) if kind]
+
+
+def test_colorize_line_word_boundary_rules():
+    kinds = _kinds("Spoke to the attorney about DRC, owes $1,250.00")
+    assert ("attorney", "lawyer") in kinds
+    assert ("DRC", "drc") in kinds
+    assert ("$1,250.00", "money") in kinds
+    # "law" inside another word is not a lawyer mention
+    assert not any(k == "lawyer" for _, k in _kinds("outlaw flaws"))
+
+
+def test_extract_datetime_from_text():
+    assert extract_datetime_from_text("note\n03/14/2024 10:15 AM\nbody") == "03/14/2024"
+    assert extract_datetime_from_text("dated 1/2/2023 only") == "1/2/2023"
+    assert extract_datetime_from_text("no date") == ""
+
+
+def test_classify_page_priority_and_thresholds():
+    from evg_splitter import classify_page
+
+    assert (
+        classify_page("Deal Note: ... Ending Balance ... Chase") == "client_notes_raw"
+    )
+    assert classify_page("UCC Financing Statement, Secured Party") == "ucc"
+    assert classify_page("Revenue Based Financing Agreement") == "contract"
+    assert classify_page("Chase Beginning Balance $10") == "bank_statements"
+    assert classify_page("Chase only") == "other"
+    assert classify_page("Chase chase CHASE") == "other"  # one distinct keyword
+
+
+def test_classify_page_counts_overlapping_keywords():
+    from evg_splitter import classify_page
+
+    # "td bank" and "bank of america" share "bank"; both must count
+    assert classify_page("td bank of america statement") == "bank_statements"
+    assert classify_page("ucc financing statement period") == "ucc"
+
+
+def _make_recovery_pdf(path, merchant="Acme LLC"):
+    import fitz
+
+    doc = fitz.open()
+    for text in (
+        f"Business Name: {merchant}\nChase ending balance",
+        "UCC Financing Statement",
+    ):
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def cached_splitter(tmp_path, monkeypatch):
+    import evg_splitter
+
+    monkeypatch.setattr(evg_splitter, "PAGE_CACHE_ENABLED", True)
+    monkeypatch.setattr(evg_splitter, "PAGE_CACHE_DIR", str(tmp_path / "cache"))
+    # Count classifications; a cache hit skips them
+    calls = []
+    real = evg_splitter._page_type
+    monkeypatch.setattr(
+        evg_splitter, "_page_type", lambda t: calls.append(t) or real(t)
+    )
+    evg_splitter.page_cache_key.cache_clear()
+    yield evg_splitter, calls
+    evg_splitter.page_cache_key.cache_clear()
+
+
+def test_page_cache_miss_then_hit(tmp_path, cached_splitter):
+    evg_splitter, calls = cached_splitter
+    pdf = tmp_path / "in.pdf"
+    _make_recovery_pdf(pdf)
+
+    first = evg_splitter.split_recovery_pdf(str(pdf), output_dir=str(tmp_path / "out"))
+    assert len(calls) == 2
+    assert len(os.listdir(evg_splitter.PAGE_CACHE_DIR)) == 1
+
+    calls.clear()
+    second = evg_splitter.split_recovery_pdf(str(pdf), output_dir=str(tmp_path / "out"))
+    assert calls == []
+    assert second == first
+
+
+def test_page_cache_invalidated_by_ocr_settings(tmp_path, cached_splitter, monkeypatch):
+    evg_splitter, calls = cached_splitter
+    pdf = tmp_path / "in.pdf"
+    _make_recovery_pdf(pdf)
+    evg_splitter.split_recovery_pdf(str(pdf), output_dir=str(tmp_path / "out"))
+
+    calls.clear()
+    monkeypatch.setattr(evg_splitter, "OCR_CONFIG", "--psm 6")
+    evg_splitter.page_cache_key.cache_clear()
+    evg_splitter.split_recovery_pdf(str(pdf), output_dir=str(tmp_path / "out"))
+    assert len(calls) == 2
+    assert len(os.listdir(evg_splitter.PAGE_CACHE_DIR)) == 2
+
+
+def test_page_cache_key_tracks_classifier_code(monkeypatch):
+    import evg_splitter
+
+    evg_splitter.page_cache_key.cache_clear()
+    before = evg_splitter.page_cache_key()
+
+    def other_page_type(text):
+        return "transaction_history" if "ach" in text else "other"
+
+    monkeypatch.setattr(evg_splitter, "_page_type", other_page_type)
+    evg_splitter.page_cache_key.cache_clear()
+    assert evg_splitter.page_cache_key() != before
+    evg_splitter.page_cache_key.cache_clear()
+
+
+def test_prune_page_cache_drops_old_and_oversized(tmp_path, monkeypatch):
+    import evg_splitter
+
+    monkeypatch.setattr(evg_splitter, "PAGE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(evg_splitter, "PAGE_CACHE_MAX_AGE_DAYS", 1)
+    monkeypatch.setattr(evg_splitter, "PAGE_CACHE_MAX_MB", 1.5)
+    now = time.time()
+    for name, age_days in (("stale", 3), ("older", 0.2), ("newer", 0.1)):
+        path = tmp_path / f"{name}.json"
+        path.write_bytes(b"x" * (1024 * 1024))
+        os.utime(path, (now - age_days * 86400,) * 2)
+
+    evg_splitter.prune_page_cache()
+    assert sorted(os.listdir(tmp_path)) == ["newer.json"]
+
+
+def test_cli_reports_failures_in_input_order(tmp_path, monkeypatch, capsys):
+    import evg_splitter
+
+    def fake_split(filepath, output_dir=None):
+        if filepath.endswith("b.pdf"):
+            raise ValueError("boom")
+        return os.path.join(output_dir, os.path.basename(filepath))
+
+    monkeypatch.setattr(evg_splitter, "split_recovery_pdf", fake_split)
+    files = []
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF-1.4")
+        files.append(str(tmp_path / name))
+
+    out = str(tmp_path / "out")
+    assert evg_splitter.main(["-j", "1", "-o", out, *files]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines()[:2] == [
+        f"✔ Split: a.pdf -> {os.path.join(out, 'a.pdf')}",
+        f"✔ Split: c.pdf -> {os.path.join(out, 'c.pdf')}",
+    ]
+    assert "Success: 2, Failed: 1" in captured.out
+    assert captured.err.strip() == f"✖ Error processing {files[1]}: boom"
+
+
+def test_cli_parallel_jobs_split_real_files(tmp_path):
+    import evg_splitter
+
+    files = []
+    for merchant in ("Acme LLC", "Beta Inc"):
+        path = tmp_path / f"{merchant.split()[0]}.pdf"
+        _make_recovery_pdf(path, merchant)
+        files.append(str(path))
+
+    out = tmp_path / "out"
+    assert evg_splitter.main(["-j", "2", "-q", "-o", str(out), *files]) == 0
+    assert (out / "Acme LLC" / "Acme LLC Recovery.pdf").exists()
+    assert (out / "Beta INC" / "Beta INC Recovery.pdf").exists()